@@ -1,2 +1,3 @@
 !pip install thefuzz
-!pip install python-Levenshtein
\ No newline at end of file
+!pip install python-Levenshtein
+!pip install rapidfuzz
\ No newline at end of file
@@ -0,0 +1,35 @@
+from pipeline import rodar_pipeline
+from scraper import CONSULTAS, url_consulta
+from streaming import rodar_streaming
+from armazenamento import abrir_planilha, publicar
+
+# --- PIPELINE COMPLETO (substitui rodar 2, 4 e 5 separados) ---
+# Raspa, pontua e busca RAM em memória e grava na planilha uma vez só no final.
+# Para refazer só uma parte a partir do último resultado salvo, troque ETAPAS,
+# ex: ["ram"] ou ["benchmark", "ram"].
+ETAPAS = ["scraper", "benchmark", "ram"]
+# Reaproveita scores e RAM de quem não mudou de specs e guarda o histórico de preço/cupom
+INCREMENTAL = True
+# Benchmark e RAM começam enquanto as páginas ainda estão sendo raspadas (sempre as três etapas,
+# ignora ETAPAS). Tempo total perto do da etapa mais lenta em vez da soma.
+STREAMING = False
+# Buscas raspadas juntas ({nome: url}, ver url_consulta em scraper.py); repetidos entram uma vez
+# só e a coluna "Consultas" diz em quais buscas cada notebook apareceu
+# ex: CONSULTAS["gamer-windows"] = url_consulta(sistemas="Windows")
+
+# --- 1. PLANILHA ---
+# "sheets" (Google Sheets), "local" (SQLite em planilha_local.sqlite, roda fora do Colab) ou "memoria"
+BACKEND = "sheets"
+# Com BACKEND = "local", copia o resultado para o Google Sheets no final (só as diferenças)
+PUBLICAR_NO_SHEETS = False
+worksheet = abrir_planilha(BACKEND)
+
+# --- 2. EXECUÇÃO ---
+if STREAMING: df, tempos = rodar_streaming(worksheet, incremental=INCREMENTAL, consultas=CONSULTAS)
+else: df, tempos = rodar_pipeline(worksheet, ETAPAS, incremental=INCREMENTAL, consultas=CONSULTAS)
+
+if BACKEND != "sheets" and PUBLICAR_NO_SHEETS:
+    print("\n📤 Publicando no Google Sheets...")
+    publicar(worksheet, abrir_planilha("sheets"))
+
+print(f"\n✅ Pipeline concluído! {len(df)} notebooks publicados.")
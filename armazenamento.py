@@ -0,0 +1,160 @@
+# --- ARMAZENAMENTO: GOOGLE SHEETS, SQLITE LOCAL OU MEMÓRIA ---
+# Todo o resto do código conversa com um "worksheet" (get_all_values, update, append_rows,
+# batch_update, clear, format...). Aqui ficam três implementações dessa mesma interface:
+# - "sheets":  a aba de verdade no Google Sheets (precisa do Colab/gspread)
+# - "local":   um arquivo SQLite local, rápido e sem limite de células, para rodadas pesadas/offline
+# - "memoria": tudo em memória, para testes
+# publicar() copia o conteúdo de uma para outra (ex: local -> Sheets de vez em quando).
+import json
+import sqlite3
+
+from gspread.utils import a1_to_rowcol
+
+from sincronizacao import sincronizar_planilha, FORMATO_PRECO
+
+NOME_PLANILHA = 'Notebooks_Scraper'
+NOME_ABA = 'Dados'
+CAMINHO_LOCAL = "planilha_local.sqlite"
+
+
+class PlanilhaEmMemoria:
+    # Imita a parte da API do gspread.Worksheet que os scripts usam.
+    # Diferença: os valores voltam exatamente como foram gravados (sem formatação de número),
+    # em qualquer value_render_option.
+    def __init__(self, linhas=None, titulo=NOME_ABA):
+        self.title = titulo
+        self.id = 0
+        self.linhas = [list(linha) for linha in (linhas or [])]
+        self.formatos = {}
+        self.col_count = max([26] + [len(linha) for linha in self.linhas])
+        self.spreadsheet = self  # deleteDimension vem via worksheet.spreadsheet.batch_update
+
+    # --- leitura ---
+    def get_all_values(self, **kwargs):
+        largura = max((len(linha) for linha in self.linhas), default=0)
+        return [linha + [""] * (largura - len(linha)) for linha in self.linhas]
+
+    @property
+    def row_count(self):
+        return max(len(self.linhas), 1000)
+
+    # --- escrita ---
+    def escrever_celula(self, linha, coluna, valor):
+        while len(self.linhas) < linha: self.linhas.append([])
+        atual = self.linhas[linha - 1]
+        while len(atual) < coluna: atual.append("")
+        atual[coluna - 1] = valor
+        self.col_count = max(self.col_count, coluna)
+
+    def escrever_bloco(self, faixa, valores):
+        linha, coluna = a1_to_rowcol(faixa.split(":")[0])
+        for i, valores_linha in enumerate(valores):
+            for j, valor in enumerate(valores_linha):
+                self.escrever_celula(linha + i, coluna + j, valor)
+
+    def update(self, values=None, range_name=None, **kwargs):
+        # Aceita as duas ordens do gspread: update(range_name, values) (5.x) e update(values, range_name) (6.x)
+        if isinstance(values, str): values, range_name = range_name, values
+        self.escrever_bloco(range_name or "A1", values)
+        self.salvar()
+
+    def batch_update(self, data, **kwargs):
+        # Worksheet.batch_update: [{"range": "H5:L5", "values": [[...]]}, ...]
+        # Spreadsheet.batch_update: {"requests": [{"deleteDimension": ...}]}
+        if isinstance(data, dict):
+            for pedido in data.get("requests", []):
+                faixa = pedido["deleteDimension"]["range"]
+                del self.linhas[faixa["startIndex"]:faixa["endIndex"]]
+        else:
+            for bloco in data:
+                self.escrever_bloco(bloco["range"], bloco["values"])
+        self.salvar()
+
+    def append_row(self, values, **kwargs):
+        self.append_rows([values])
+
+    def append_rows(self, values, **kwargs):
+        # Como no Sheets: entra depois da última linha com conteúdo
+        while self.linhas and not any(v != "" for v in self.linhas[-1]): self.linhas.pop()
+        self.linhas.extend(list(linha) for linha in values)
+        self.salvar()
+
+    def add_cols(self, quantidade):
+        self.col_count += quantidade
+
+    def clear(self):
+        self.linhas = []
+        self.salvar()
+
+    def format(self, faixa, formato):
+        self.formatos[faixa] = formato
+        self.salvar()
+
+    def salvar(self):
+        # Em memória não há o que persistir
+        pass
+
+
+class PlanilhaLocal(PlanilhaEmMemoria):
+    # Mesma coisa, mas persistida num SQLite (uma linha da aba por registro, valores em JSON
+    # para manter número como número e texto como texto)
+    def __init__(self, caminho=CAMINHO_LOCAL, titulo=NOME_ABA):
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.executescript("""
+            CREATE TABLE IF NOT EXISTS linhas (aba TEXT, posicao INTEGER, valores TEXT, PRIMARY KEY (aba, posicao));
+            CREATE TABLE IF NOT EXISTS formatos (aba TEXT, faixa TEXT, formato TEXT, PRIMARY KEY (aba, faixa));
+        """)
+        linhas = [json.loads(v) for (v,) in self.conexao.execute(
+            "SELECT valores FROM linhas WHERE aba = ? ORDER BY posicao", (titulo,)
+        )]
+        super().__init__(linhas, titulo)
+        self.formatos = {faixa: json.loads(f) for faixa, f in self.conexao.execute(
+            "SELECT faixa, formato FROM formatos WHERE aba = ?", (titulo,)
+        )}
+
+    def salvar(self):
+        with self.conexao:
+            self.conexao.execute("DELETE FROM linhas WHERE aba = ?", (self.title,))
+            self.conexao.executemany(
+                "INSERT INTO linhas VALUES (?, ?, ?)",
+                [(self.title, i, json.dumps(linha, ensure_ascii=False)) for i, linha in enumerate(self.linhas)],
+            )
+            self.conexao.execute("DELETE FROM formatos WHERE aba = ?", (self.title,))
+            self.conexao.executemany(
+                "INSERT INTO formatos VALUES (?, ?, ?)",
+                [(self.title, faixa, json.dumps(f)) for faixa, f in self.formatos.items()],
+            )
+
+
+def abrir_planilha_sheets(nome=NOME_PLANILHA, aba=NOME_ABA):
+    # Imports aqui dentro: os outros backends funcionam fora do Colab
+    from google.colab import auth
+    import gspread
+    from google.auth import default
+
+    print("Autenticando no Google...")
+    auth.authenticate_user()
+    creds, _ = default()
+    gc = gspread.authorize(creds)
+    try:
+        sh = gc.open(nome)
+        return sh.worksheet(aba)
+    except Exception as e:
+        print(f"❌ Erro ao abrir planilha: {e}")
+        raise e
+
+
+def abrir_planilha(backend="sheets", aba=NOME_ABA, caminho=CAMINHO_LOCAL):
+    if backend == "sheets": return abrir_planilha_sheets(aba=aba)
+    if backend == "local": return PlanilhaLocal(caminho, aba)
+    if backend == "memoria": return PlanilhaEmMemoria(titulo=aba)
+    raise ValueError(f"Backend desconhecido: {backend} (use 'sheets', 'local' ou 'memoria')")
+
+
+def publicar(origem, destino, formatos=None):
+    # Leva o conteúdo de uma aba para outra mandando só as diferenças (ex: local -> Sheets)
+    tabela = origem.get_all_values(value_render_option="UNFORMATTED_VALUE")
+    if not tabela:
+        print("⚠️ Origem vazia, nada para publicar.")
+        return None
+    return sincronizar_planilha(destino, tabela, formatos=FORMATO_PRECO if formatos is None else formatos)
@@ -0,0 +1,197 @@
+# --- FIXTURES HTML PARA O BENCHMARK OFFLINE ---
+# Páginas no mesmo formato dos sites, guardadas em benchmarks/fixtures/:
+#   listagem.html        -> div.list_item (quenotebookcomprar.com.br, os links apontam para produtos/)
+#   produtos/<n>.html    -> div.spec-row.ram (página de cada notebook)
+#   charts/<TIPO>.html   -> ul.chartlist (PassMark, um arquivo por tipo de FONTES_BENCHMARK)
+# Duas origens: gravar_fixtures() baixa páginas de verdade dos sites; gerar_fixtures() monta
+# páginas sintéticas determinísticas (mesmos seletores), para rodar sem internet nenhuma.
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from html import escape
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path: sys.path.insert(0, RAIZ)
+
+from passmark import FONTES_BENCHMARK
+
+PASTA_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def escrever(pasta, nome, conteudo):
+    caminho = os.path.join(pasta, nome)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+
+
+def ler(pasta, nome):
+    with open(os.path.join(pasta, nome), encoding="utf-8") as f:
+        return f.read()
+
+
+def listar_produtos(pasta=PASTA_FIXTURES):
+    # Nomes relativos ("produtos/0.html", ...) na ordem numérica
+    nomes = os.listdir(os.path.join(pasta, "produtos"))
+    return [f"produtos/{n}" for n in sorted(nomes, key=lambda n: int(n.split(".")[0]))]
+
+
+# --- SINTÉTICAS ---
+def nomes_cpu(rnd):
+    nomes = []
+    for geracao in range(10, 15):
+        for nivel in (3, 5, 7, 9):
+            for sku in rnd.sample(range(100, 1000, 50), 6):
+                for sufixo in ("H", "HX", "U"):
+                    nomes.append(f"Intel Core i{nivel}-{geracao}{sku:03d}{sufixo}")
+    for serie in (5, 6, 7, 8):
+        for nivel in (5, 7, 9):
+            for sku in rnd.sample(range(500, 1000, 50), 5):
+                for sufixo in ("H", "HS", "U"):
+                    nomes.append(f"AMD Ryzen {nivel} {serie}{sku}{sufixo}")
+    return nomes
+
+
+def nomes_gpu():
+    nomes = []
+    for serie in ("RTX 20", "RTX 30", "RTX 40", "GTX 16"):
+        for modelo in ("50", "60", "70", "80"):
+            nomes.append(f"NVIDIA GeForce {serie}{modelo} Laptop GPU")
+            nomes.append(f"NVIDIA GeForce {serie}{modelo}")
+    for modelo in ("6500M", "6600M", "6700S", "7600S", "7700S"):
+        nomes.append(f"AMD Radeon RX {modelo}")
+    nomes += ["Intel Arc A370M", "Intel Arc A550M", "Intel UHD Graphics", "Intel Iris Xe", "AMD Radeon Graphics"]
+    return nomes
+
+
+def html_enchimento(rnd, links=150, paragrafos=60):
+    # O resto de uma página real: menu, scripts, rodapé. Não é lido, mas pesa no parse.
+    menu = "".join(f'<li class="menu-item"><a href="/pagina/{i}">Item de menu {i}</a></li>' for i in range(links))
+    script = "var dados = [" + ",".join(str(rnd.randint(0, 99999)) for _ in range(2000)) + "];"
+    rodape = "".join(f"<p class=\"texto\">Parágrafo {i} com <b>texto</b> e <a href=\"#\">link</a>.</p>" for i in range(paragrafos))
+    return (f'<header><nav><ul class="menu">{menu}</ul></nav></header><script>{script}</script>',
+            f'<footer><div class="widgets">{rodape}</div></footer>')
+
+
+def html_chartlist(itens, rnd):
+    topo, rodape = html_enchimento(rnd, links=300, paragrafos=200)
+    linhas = "\n".join(
+        f'<li id="rk{i}"><span class="more_details"></span><a href="#"><span class="prdname">{escape(nome)}</span>'
+        f'<div><span class="index pink" style="width: 50%">({score / 1000:.1f}%)</span></div>'
+        f'<span class="count">{score:,}</span><span class="price-neww">NA</span></a></li>'
+        for i, (nome, score) in enumerate(itens)
+    )
+    return f'<html><body>{topo}<div class="chart_body"><ul class="chartlist">\n{linhas}\n</ul></div>{rodape}</body></html>'
+
+
+def html_card(n, modelo, preco, cupom, cpu, gpu, ram, com_desconto):
+    if com_desconto: bloco_preco = f'<div class="lowest-price"><a href="#">{preco}</a></div>'
+    else: bloco_preco = f'<div class="lowest-price-without-discounts"><p><b>{preco}</b></p></div>'
+    cupom_html = f'<div class="coupon"><span class="coupon-code">{cupom}</span></div>' if cupom else ""
+    return f"""
+<div class="list_item">
+  <div class="infos"><h4><a href="/produtos/{n}.html">{escape(modelo)}</a></h4></div>
+  <div class="spec_stamps">
+    <div class="spec_stamp cpu"><span>{escape(cpu)}</span></div>
+    <div class="spec_stamp gpu"><span>{escape(gpu)}<br>Dedicada</span></div>
+  </div>
+  <div class="spec_stamps mobile"><span class="spec_mobile">{ram}</span><span class="spec_mobile">512GB SSD</span></div>
+  <div class="buy-box">{bloco_preco}{cupom_html}</div>
+</div>"""
+
+
+def html_produto(rnd):
+    geracao = rnd.choice(["DDR4", "DDR5", "LPDDR5X", "LPDDR4X"])
+    total = rnd.choice([8, 16, 32])
+    soldada = rnd.random() < 0.4
+    slots = rnd.choice([0, 1, 2]) if not geracao.startswith("LP") else 0
+    itens = [
+        f'<li class="spec_ram_installed_capacity_and_type">{total}GB {geracao}</li>',
+        f'<li class="spec_ram_max_capacity">Máximo de {total * 2}GB</li>',
+        f'<li class="spec_ram_onboard">{total // 2}GB soldada na placa</li>' if soldada
+        else '<li class="spec_ram_onboard not-available">Não possui memória soldada</li>',
+    ]
+    for s in (1, 2):
+        if s <= slots: itens.append(f'<li class="spec_ram_slot_{s}">Slot {s}: <b>{total // max(slots, 1)} GB</b></li>')
+        else: itens.append(f'<li class="spec_ram_slot_{s} not-available">Slot {s}: Não possui</li>')
+    ram = "\n    ".join(itens)
+    topo, rodape = html_enchimento(rnd)
+    return f"""<html><body>{topo}
+<div class="spec-row cpu"><ul><li>Processador</li></ul></div>
+<div class="spec-row ram">
+  <ul>
+    {ram}
+  </ul>
+</div>
+<div class="spec-row storage"><ul><li>512GB SSD</li></ul></div>
+{rodape}</body></html>"""
+
+
+def limpar(pasta):
+    # Fixtures de outra origem não podem sobrar misturadas (ex: produtos a mais)
+    if os.path.isdir(pasta): shutil.rmtree(pasta)
+
+
+def gerar_fixtures(pasta=PASTA_FIXTURES, num_cards=200, semente=42):
+    limpar(pasta)
+    rnd = random.Random(semente)
+    cpus = nomes_cpu(rnd)
+    gpus = nomes_gpu()
+
+    # Charts: metade de cima no high-end, metade de baixo no mid-range (como no PassMark)
+    for tipo, categoria, _ in FONTES_BENCHMARK:
+        nomes = cpus if categoria == "cpu" else gpus
+        itens = sorted(((nome, rnd.randint(1000, 40000)) for nome in nomes), key=lambda item: -item[1])
+        metade = len(itens) // 2
+        escrever(pasta, f"charts/{tipo}.html", html_chartlist(itens[:metade] if tipo in ("CPU", "GPU") else itens[metade:], rnd))
+
+    # Listagem: CPUs/GPUs do jeito que aparecem nos cards (sem fabricante, "GeForce", etc.)
+    cards = []
+    for n in range(num_cards):
+        cpu = rnd.choice(cpus).replace("Intel ", "").replace("AMD ", "") if rnd.random() < 0.95 else "Processador Genérico X1"
+        gpu = rnd.choice(gpus).replace("NVIDIA ", "").replace(" Laptop GPU", "").replace("AMD ", "")
+        preco = f"R$ {rnd.randint(2500, 15000):,}".replace(",", ".") + f",{rnd.randint(0, 99):02d}"
+        cupom = rnd.choice(["", "", "NOTE10", "GAMER5"])
+        ram = f"{rnd.choice([8, 16, 32])}GB RAM"
+        cards.append(html_card(n, f"Notebook Gamer {n:03d}", preco, cupom, cpu, gpu, ram, rnd.random() < 0.5))
+        escrever(pasta, f"produtos/{n}.html", html_produto(rnd))
+    escrever(pasta, "listagem.html", '<html><body><span class="pages">Página 1 de 1</span>' + "".join(cards) + "</body></html>")
+
+    escrever(pasta, "origem.json", json.dumps({"origem": "sintetica", "semente": semente, "criado_em": time.time()}))
+    print(f"🧪 Fixtures sintéticas em {pasta}: {num_cards} cards/produtos, {len(cpus)} CPUs, {len(gpus)} GPUs.")
+
+
+# --- GRAVADAS DOS SITES ---
+def gravar_fixtures(pasta=PASTA_FIXTURES, url_listagem=None, max_produtos=40):
+    # Precisa de internet. Os links dos cards são reescritos para produtos/<n>.html,
+    # então o benchmark nunca sai da máquina depois de gravado.
+    from bs4 import BeautifulSoup
+    from cliente_http import ClienteHTTP
+
+    if url_listagem is None:
+        from scraper import URL_BASE
+        url_listagem = URL_BASE
+    cliente = ClienteHTTP()
+    limpar(pasta)
+
+    for tipo, _, url in FONTES_BENCHMARK:
+        print(f"📥 {tipo}: {url}")
+        escrever(pasta, f"charts/{tipo}.html", cliente.get(url, timeout=20).text)
+
+    soup = BeautifulSoup(cliente.get(url_listagem, timeout=20).text, "html.parser")
+    cards = soup.select("div.list_item")
+    for card in cards[max_produtos:]:
+        card.decompose()
+    for n, card in enumerate(cards[:max_produtos]):
+        titulo = card.select_one("div.infos h4 a")
+        if not titulo or not titulo.get("href"): continue
+        print(f"📥 Produto {n}: {titulo['href']}")
+        escrever(pasta, f"produtos/{n}.html", cliente.get(titulo["href"], timeout=15).text)
+        titulo["href"] = f"/produtos/{n}.html"
+    escrever(pasta, "listagem.html", str(soup))
+
+    escrever(pasta, "origem.json", json.dumps({"origem": url_listagem, "criado_em": time.time()}))
+    print(f"🎞️ Fixtures gravadas em {pasta}: {min(len(cards), max_produtos)} produtos.")
@@ -0,0 +1,348 @@
+# --- BENCHMARK OFFLINE (FIXTURES + SERVIDOR HTTP LOCAL) ---
+# Mede as partes quentes do pipeline sem tocar em quenotebookcomprar.com.br nem no PassMark:
+#   cards          -> leitura dos div.list_item sem navegador (scraper_http) + montar_registro
+#   cards_selenium -> extrair_dados_da_pagina num Chrome de verdade (só se houver Chrome/chromedriver)
+#   ram            -> extrair_detalhes_ram nas páginas de produto (só o parse)
+#   charts         -> baixar_tabela_benchmark_rapido nas ul.chartlist (só o parse)
+#   matching       -> scores_cpu/scores_gpu com motores novos (sem memo de rodada anterior)
+#   ponta_a_ponta  -> listagem (modo HTTP) + charts + páginas de RAM pelo HTTP local, etapa_benchmark e enriquecer_ram
+# Cada caso guarda a vazão (itens/s) e um hash da SAÍDA. Falha se a vazão cair mais que
+# LIMIAR_REGRESSAO contra a baseline desta máquina ou se a saída mudar em relação a saidas.json
+# (versionado): otimização nenhuma pode alterar o que é extraído.
+#
+# Uso (de qualquer pasta):
+#   python benchmarks/rodar_benchmarks.py                    # compara com baseline.json e saidas.json
+#   python benchmarks/rodar_benchmarks.py --salvar-baseline  # grava a baseline desta máquina (e saidas.json)
+#   python benchmarks/rodar_benchmarks.py --gerar            # refaz as fixtures sintéticas
+#   python benchmarks/rodar_benchmarks.py --gravar           # grava fixtures dos sites (precisa de internet)
+import argparse
+import hashlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+
+# fixtures vem primeiro: é ele que põe a raiz do repositório no sys.path
+from fixtures import PASTA_FIXTURES, gerar_fixtures, gravar_fixtures, ler, listar_produtos
+
+import pandas as pd
+
+from cliente_http import ClienteHTTP
+from correspondencia import MotorCorrespondencia, scores_cpu, scores_gpu
+from passmark import FONTES_BENCHMARK, baixar_tabela_benchmark_rapido, baixar_todas, juntar_por_categoria
+from pipeline import etapa_benchmark, tabela_para_linhas
+from ram import enriquecer_ram, extrair_detalhes_ram
+from scraper import COLUNAS_LISTAGEM, montar_registros
+from scraper_http import cards_brutos_html, raspar
+
+# Vazões variam de máquina para máquina: baseline.json fica fora do git. As saídas das fixtures
+# sintéticas (geradas com semente fixa) são as mesmas em qualquer lugar e ficam em saidas.json, versionado.
+CAMINHO_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+CAMINHO_SAIDAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saidas.json")
+# Cada caso roda pelo menos REPETICOES vezes e até somar TEMPO_MINIMO segundos; vale o melhor
+# tempo (o mínimo sofre bem menos com ruído da máquina que a mediana de poucas execuções)
+REPETICOES = 5
+TEMPO_MINIMO = 0.5
+# Caso que parece mais lento é medido de novo até CONFIRMACOES vezes (vale a melhor medição):
+# uma janela ruim da máquina não vira regressão, uma regressão de verdade continua lá
+CONFIRMACOES = 2
+# A baseline é a rodada mediana de RODADAS_BASELINE (o melhor de uma rodada só pode ter sido sorte)
+RODADAS_BASELINE = 3
+# Vazão abaixo de (1 - LIMIAR_REGRESSAO) x baseline conta como regressão
+LIMIAR_REGRESSAO = 0.25
+
+
+# --- SERVIDOR E CLIENTE DE MENTIRA ---
+class HandlerSilencioso(SimpleHTTPRequestHandler):
+    # Fixtures são UTF-8: sem charset no Content-Type o requests decodifica como ISO-8859-1
+    # ("máximo" vira "mã¡ximo"), diferente dos sites de verdade
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map, ".html": "text/html; charset=utf-8"}
+
+    def log_message(self, *args):
+        pass
+
+
+class ServidorFixtures:
+    # http.server numa thread, servindo a pasta de fixtures em http://127.0.0.1:<porta>/
+    def __init__(self, pasta=PASTA_FIXTURES):
+        self.pasta = pasta
+
+    def __enter__(self):
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), partial(HandlerSilencioso, directory=self.pasta))
+        self.url = f"http://127.0.0.1:{self.servidor.server_port}/"
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+
+class RespostaFixa:
+    def __init__(self, texto):
+        self.status_code = 200
+        self.text = texto
+
+
+class ClienteFixo:
+    # Mesmo get() do ClienteHTTP, mas devolvendo o HTML já em memória: mede só o parse
+    def __init__(self, paginas):
+        self.paginas = paginas
+
+    def get(self, url, **kwargs):
+        return RespostaFixa(self.paginas[url])
+
+
+def fontes_locais(url):
+    return [(tipo, categoria, urljoin(url, f"charts/{tipo}.html")) for tipo, categoria, _ in FONTES_BENCHMARK]
+
+
+# --- CASOS ---
+# Cada caso recebe o contexto e devolve (quantidade de itens processados, saída comparável)
+def caso_cards(ctx):
+    # Mesmo caminho do modo HTTP do scraper (scraper_http), sem a rede
+    registros = montar_registros(cards_brutos_html(ctx["listagem"], ctx["url"]))
+    return len(registros), registros
+
+
+def caso_cards_selenium(ctx):
+    from scraper import extrair_dados_da_pagina
+    registros = extrair_dados_da_pagina(ctx["driver"])
+    return len(registros), registros
+
+
+def caso_ram(ctx):
+    cliente = ClienteFixo(ctx["produtos"])
+    infos = [extrair_detalhes_ram(url, cliente) for url in ctx["produtos"]]
+    return len(infos), infos
+
+
+def caso_charts(ctx):
+    cliente = ClienteFixo(ctx["charts"])
+    tabelas = {tipo: baixar_tabela_benchmark_rapido(url, tipo, cliente) for tipo, _, url in fontes_locais(ctx["url"])}
+    return sum(len(t) for t in tabelas.values()), tabelas
+
+
+def caso_matching(ctx):
+    registros = ctx["registros"]
+    cpus = scores_cpu([r[3] for r in registros], MotorCorrespondencia(ctx["cpu_db"]))
+    gpus = scores_gpu([r[4] for r in registros], MotorCorrespondencia(ctx["gpu_db"]))
+    return 2 * len(registros), [cpus, gpus]
+
+
+def caso_ponta_a_ponta(ctx):
+    # Tudo pela rede local, com o cliente de verdade (sem cache e sem limite de taxa que atrapalhe)
+    cliente = ClienteHTTP(req_por_segundo=10000, max_conexoes=16)
+    url_listagem = urljoin(ctx["url"], "listagem.html")
+    df = pd.DataFrame(raspar(url_listagem, cliente=cliente, fallback_selenium=False), columns=COLUNAS_LISTAGEM)
+    fontes = fontes_locais(ctx["url"])
+    cpu_db, gpu_db = juntar_por_categoria(baixar_todas(cliente, fontes), fontes)
+    df = etapa_benchmark(df, cpu_db, gpu_db)
+    df = enriquecer_ram(df, cliente, max_workers=8)
+    return len(df), tabela_para_linhas(df)
+
+
+CASOS = {
+    "cards": caso_cards,
+    "cards_selenium": caso_cards_selenium,
+    "ram": caso_ram,
+    "charts": caso_charts,
+    "matching": caso_matching,
+    "ponta_a_ponta": caso_ponta_a_ponta,
+}
+
+
+# --- EXECUÇÃO ---
+def hash_saida(saida, url):
+    # URLs do servidor local trocam de porta: normaliza antes do hash
+    texto = json.dumps(saida, sort_keys=True, ensure_ascii=False, default=str).replace(url, "http://fixtures/")
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def hash_fixtures(pasta=PASTA_FIXTURES):
+    h = hashlib.sha1()
+    for raiz, _, arquivos in sorted(os.walk(pasta)):
+        for nome in sorted(arquivos):
+            if not nome.endswith(".html"): continue
+            h.update(os.path.relpath(os.path.join(raiz, nome), pasta).encode("utf-8"))
+            with open(os.path.join(raiz, nome), "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def montar_contexto(url, pasta=PASTA_FIXTURES):
+    # Lê as fixtures para a memória e prepara o que os casos consomem (fora da medição)
+    ctx = {"url": url, "listagem": ler(pasta, "listagem.html")}
+    ctx["produtos"] = {urljoin(url, nome): ler(pasta, nome) for nome in listar_produtos(pasta)}
+    ctx["charts"] = {u: ler(pasta, f"charts/{tipo}.html") for tipo, _, u in fontes_locais(url)}
+    ctx["registros"] = montar_registros(cards_brutos_html(ctx["listagem"], url))
+    with redirect_stdout(io.StringIO()):
+        _, tabelas = caso_charts(ctx)
+    fontes = fontes_locais(url)
+    ctx["cpu_db"], ctx["gpu_db"] = juntar_por_categoria({tipo: {"dados": tabelas[tipo]} for tipo, _, _ in fontes}, fontes)
+    return ctx
+
+
+def abrir_chrome(ctx):
+    # Caso cards_selenium: só roda onde existir Chrome + chromedriver
+    try:
+        from scraper import criar_driver, esperar_pagina_pronta
+        driver = criar_driver()
+    except Exception as e:
+        print(f"⏭️ cards_selenium pulado (sem Chrome: {str(e).splitlines()[0] if str(e) else type(e).__name__})")
+        return None
+    driver.get(urljoin(ctx["url"], "listagem.html"))
+    with redirect_stdout(io.StringIO()):
+        esperar_pagina_pronta(driver, "Fixture")
+    return driver
+
+
+def medir(nome, funcao, ctx, repeticoes=REPETICOES, tempo_minimo=TEMPO_MINIMO):
+    tempos = []
+    while len(tempos) < repeticoes or sum(tempos) < tempo_minimo:
+        with redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            quantidade, saida = funcao(ctx)
+            tempos.append(time.perf_counter() - inicio)
+    melhor = min(tempos)
+    return {
+        "itens": quantidade,
+        "segundos": melhor,
+        "mediana": statistics.median(tempos),
+        "execucoes": len(tempos),
+        "itens_por_s": quantidade / melhor if melhor > 0 else float("inf"),
+        "saida": hash_saida(saida, ctx["url"]),
+    }
+
+
+def rodar(casos=None, repeticoes=REPETICOES, pasta=PASTA_FIXTURES, tempo_minimo=TEMPO_MINIMO):
+    resultados = {}
+    with ServidorFixtures(pasta) as servidor:
+        ctx = montar_contexto(servidor.url, pasta)
+        for nome in casos or CASOS:
+            if nome == "cards_selenium":
+                ctx["driver"] = abrir_chrome(ctx)
+                if ctx["driver"] is None: continue
+            try:
+                resultados[nome] = medir(nome, CASOS[nome], ctx, repeticoes, tempo_minimo)
+            finally:
+                if nome == "cards_selenium": ctx.pop("driver").quit()
+            r = resultados[nome]
+            print(f"⏱️ {nome:<15} {r['itens']:>6} itens | {r['segundos'] * 1000:>9.1f} ms (mediana {r['mediana'] * 1000:.1f}, "
+                  f"{r['execucoes']}x) | {r['itens_por_s']:>10.0f} itens/s")
+    return resultados
+
+
+def comparar(resultados, baseline=None, saidas=None, limiar=LIMIAR_REGRESSAO):
+    # baseline: vazões desta máquina (pode faltar); saidas: hashes versionados das fixtures sintéticas.
+    # Devolve a lista de problemas (vazia = tudo certo)
+    problemas = []
+    for nome, r in resultados.items():
+        status, detalhe = "✅", ""
+        esperada = (saidas or {}).get(nome) or ((baseline or {}).get("casos", {}).get(nome) or {}).get("saida")
+        if esperada and r["saida"] != esperada:
+            problemas.append(f"{nome}: saída diferente da baseline")
+            status = "❌ SAÍDA MUDOU"
+        base = (baseline or {}).get("casos", {}).get(nome)
+        if base:
+            variacao = r["itens_por_s"] / base["itens_por_s"] - 1
+            if variacao < -limiar and status == "✅":
+                problemas.append(f"{nome}: vazão {variacao:+.0%} (limite -{limiar:.0%})")
+                status = "❌ REGRESSÃO"
+            detalhe = f"{variacao:+7.1%} vs baseline ({base['itens_por_s']:.0f} itens/s)"
+        else: detalhe = "sem baseline de vazão nesta máquina"
+        if not esperada: detalhe += " | saída sem referência"
+        print(f"{status} {nome:<15} {detalhe}")
+    return problemas
+
+
+def casos_lentos(resultados, baseline, limiar=LIMIAR_REGRESSAO):
+    casos = (baseline or {}).get("casos", {})
+    return [nome for nome, r in resultados.items()
+            if nome in casos and r["itens_por_s"] / casos[nome]["itens_por_s"] - 1 < -limiar]
+
+
+def ler_json(caminho):
+    if not os.path.exists(caminho): return None
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def gravar_json(caminho, dados):
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(dados, f, indent=2)
+        f.write("\n")
+
+
+def fixtures_sinteticas(pasta=PASTA_FIXTURES):
+    return (ler_json(os.path.join(pasta, "origem.json")) or {}).get("origem") == "sintetica"
+
+
+def principal(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark offline do scraper/benchmark/RAM")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava os resultados como nova baseline")
+    parser.add_argument("--gerar", action="store_true", help="refaz as fixtures sintéticas antes de medir")
+    parser.add_argument("--gravar", action="store_true", help="grava fixtures dos sites de verdade antes de medir")
+    parser.add_argument("--casos", nargs="*", choices=list(CASOS), help="só estes casos")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES, help="mínimo de execuções por caso")
+    parser.add_argument("--tempo-minimo", type=float, default=TEMPO_MINIMO, help="segundos mínimos medindo cada caso")
+    parser.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO)
+    args = parser.parse_args(argv)
+
+    if args.gravar: gravar_fixtures()
+    elif args.gerar or not os.path.exists(os.path.join(PASTA_FIXTURES, "listagem.html")): gerar_fixtures()
+
+    fixtures = hash_fixtures()
+    resultados = rodar(args.casos, args.repeticoes, tempo_minimo=args.tempo_minimo)
+
+    if args.salvar_baseline:
+        rodadas = [resultados] + [rodar(args.casos, args.repeticoes, tempo_minimo=args.tempo_minimo) for _ in range(RODADAS_BASELINE - 1)]
+        resultados = {
+            nome: sorted((rodada[nome] for rodada in rodadas), key=lambda r: r["itens_por_s"])[len(rodadas) // 2]
+            for nome in resultados
+        }
+        baseline = {"fixtures": fixtures, "maquina": platform.node(), "criado_em": time.time(), "casos": resultados}
+        gravar_json(CAMINHO_BASELINE, baseline)
+        print(f"💾 Baseline de vazão salva em {CAMINHO_BASELINE}")
+        if fixtures_sinteticas():
+            # Só as saídas das fixtures sintéticas (iguais em qualquer máquina) vão para o repositório
+            saidas = (ler_json(CAMINHO_SAIDAS) or {}).get("casos", {}) if (ler_json(CAMINHO_SAIDAS) or {}).get("fixtures") == fixtures else {}
+            saidas.update({nome: r["saida"] for nome, r in resultados.items()})
+            gravar_json(CAMINHO_SAIDAS, {"fixtures": fixtures, "casos": dict(sorted(saidas.items()))})
+            print(f"💾 Saídas de referência salvas em {CAMINHO_SAIDAS}")
+        return 0
+
+    baseline = ler_json(CAMINHO_BASELINE)
+    if baseline and baseline["fixtures"] != fixtures:
+        print("⚠️ A baseline de vazão foi feita com outras fixtures: rode com --salvar-baseline para comparar.")
+        baseline = None
+    saidas = ler_json(CAMINHO_SAIDAS)
+    saidas = saidas["casos"] if saidas and saidas["fixtures"] == fixtures else None
+    if baseline is None and saidas is None:
+        print("⚠️ Sem baseline nem saídas de referência para estas fixtures: rode com --salvar-baseline.")
+        return 0
+    if baseline is None: print("ℹ️ Sem baseline de vazão nesta máquina: só as saídas são conferidas.")
+
+    for _ in range(CONFIRMACOES):
+        lentos = casos_lentos(resultados, baseline, args.limiar)
+        if not lentos: break
+        print(f"🔁 Medindo de novo para confirmar: {', '.join(lentos)}")
+        for nome, r in rodar(lentos, args.repeticoes, tempo_minimo=args.tempo_minimo).items():
+            if r["itens_por_s"] > resultados[nome]["itens_por_s"]: resultados[nome] = r
+
+    problemas = comparar(resultados, baseline, saidas, args.limiar)
+    for problema in problemas: print(f"❌ {problema}")
+    if not problemas: print("✅ Sem regressões.")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
@@ -0,0 +1,100 @@
+# --- CACHE HTTP EM DISCO ---
+# Guarda as respostas 200 por URL num SQLite local, com validade (TTL), limite de tamanho
+# (remove as menos acessadas recentemente - LRU) e revalidação por ETag/Last-Modified.
+# Usado pelo ClienteHTTP: quem chama continua recebendo um requests.Response normal.
+import json
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CAMINHO_CACHE = "cache_http.sqlite"
+TTL_PADRAO = 12 * 3600              # 12h: reexecuções no mesmo dia não vão à rede
+TAMANHO_MAXIMO = 200 * 1024 * 1024  # 200 MB
+
+
+class CacheHTTP:
+    def __init__(self, caminho=CAMINHO_CACHE, ttl=TTL_PADRAO, tamanho_maximo=TAMANHO_MAXIMO):
+        self.ttl = ttl
+        self.tamanho_maximo = tamanho_maximo
+        self.trava = threading.Lock()
+        # Uma conexão só, protegida pela trava, para poder ser usada pelos workers
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.execute("""
+            CREATE TABLE IF NOT EXISTS respostas (
+                url TEXT PRIMARY KEY,
+                headers TEXT,
+                encoding TEXT,
+                corpo BLOB,
+                tamanho INTEGER,
+                salvo_em REAL,
+                acessado_em REAL
+            )
+        """)
+        self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_acessado ON respostas (acessado_em)")
+        self.conexao.commit()
+
+    def ler(self, url):
+        # Devolve a entrada salva (fresca ou não) ou None
+        with self.trava:
+            linha = self.conexao.execute(
+                "SELECT headers, encoding, corpo, salvo_em FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+            if not linha: return None
+            self.conexao.execute("UPDATE respostas SET acessado_em = ? WHERE url = ?", (time.time(), url))
+            self.conexao.commit()
+        headers, encoding, corpo, salvo_em = linha
+        return {"headers": json.loads(headers), "encoding": encoding, "corpo": corpo, "salvo_em": salvo_em}
+
+    def esta_fresca(self, entrada, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() - entrada["salvo_em"] < ttl
+
+    def salvar(self, url, resposta):
+        # Só respostas 200 completas entram no cache
+        corpo = resposta.content
+        headers = {k: resposta.headers[k] for k in ("ETag", "Last-Modified", "Content-Type") if k in resposta.headers}
+        agora = time.time()
+        with self.trava:
+            self.conexao.execute(
+                "INSERT OR REPLACE INTO respostas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, json.dumps(headers), resposta.encoding, corpo, len(corpo), agora, agora),
+            )
+            self.podar()
+            self.conexao.commit()
+
+    def renovar(self, url):
+        # Servidor respondeu 304: o conteúdo continua valendo, só reinicia o TTL
+        agora = time.time()
+        with self.trava:
+            self.conexao.execute("UPDATE respostas SET salvo_em = ?, acessado_em = ? WHERE url = ?", (agora, agora, url))
+            self.conexao.commit()
+
+    def podar(self):
+        # LRU: apaga as entradas acessadas há mais tempo até caber no limite (chamar com a trava)
+        total = self.conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM respostas").fetchone()[0]
+        if total <= self.tamanho_maximo: return
+        for url, tamanho in self.conexao.execute("SELECT url, tamanho FROM respostas ORDER BY acessado_em").fetchall():
+            self.conexao.execute("DELETE FROM respostas WHERE url = ?", (url,))
+            total -= tamanho
+            if total <= self.tamanho_maximo: break
+
+    def headers_condicionais(self, entrada):
+        # If-None-Match / If-Modified-Since para revalidar uma entrada vencida
+        headers = {}
+        if entrada["headers"].get("ETag"): headers["If-None-Match"] = entrada["headers"]["ETag"]
+        if entrada["headers"].get("Last-Modified"): headers["If-Modified-Since"] = entrada["headers"]["Last-Modified"]
+        return headers
+
+    def como_resposta(self, url, entrada):
+        # Remonta um requests.Response a partir do que está salvo
+        resposta = requests.Response()
+        resposta.status_code = 200
+        resposta.url = url
+        resposta._content = entrada["corpo"]
+        resposta.headers = CaseInsensitiveDict(entrada["headers"])
+        resposta.encoding = entrada["encoding"]
+        resposta.do_cache = True
+        return resposta
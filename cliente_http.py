@@ -0,0 +1,273 @@
+# --- CLIENTE HTTP COMPARTILHADO ---
+# Sessão com pool de conexões keep-alive + limite de requisições por host (token bucket),
+# cache em disco opcional (cache_http) e um helper para buscar vários links em paralelo
+# devolvendo tudo na ordem original.
+# Falhas passageiras não viram dado zerado: 429, 5xx e timeouts são refeitos com backoff
+# exponencial + jitter (respeitando Retry-After), a concorrência de cada host se ajusta sozinha
+# (AIMD: sobe devagar enquanto o host responde rápido, cai pela metade quando ele reclama) e
+# um host que só falha é "desligado" por um tempo (circuit breaker) em vez de levar timeout atrás de timeout.
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metricas import METRICAS
+
+HEADERS_NAVEGADOR = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# --- RETENTATIVAS ---
+MAX_TENTATIVAS = 4
+STATUS_RETENTAVEIS = {429, 500, 502, 503, 504}
+STATUS_THROTTLING = {429, 503}   # o host pediu para ir mais devagar (503 só quando vem com Retry-After)
+BACKOFF_BASE = 0.5               # 1ª espera ~0.5s, depois ~1s, ~2s... (com jitter)
+BACKOFF_TETO = 30
+RETRY_AFTER_TETO = 120           # Retry-After maior que isso é tratado como esse teto
+
+# --- CONCORRÊNCIA POR HOST (AIMD) ---
+CONCORRENCIA_INICIAL = 2
+LATENCIA_SAUDAVEL = 2.0          # segundos; acima disso a concorrência para de subir
+
+# --- CIRCUIT BREAKER ---
+FALHAS_PARA_ABRIR = 5            # falhas seguidas (5xx, conexão, timeout) no mesmo host; 429 não conta
+TEMPO_CIRCUITO_ABERTO = 60       # segundos sem tentar aquele host
+ESPERA_CIRCUITO = 90             # quanto uma requisição espera pelo teste do circuito antes de desistir
+
+
+class CircuitoAberto(requests.exceptions.ConnectionError):
+    pass
+
+
+def espera_backoff(tentativa):
+    # Exponencial com "equal jitter": metade fixa, metade aleatória (threads não voltam juntas)
+    teto = min(BACKOFF_TETO, BACKOFF_BASE * (2 ** tentativa))
+    return teto / 2 + random.uniform(0, teto / 2)
+
+
+def ler_retry_after(resposta):
+    # Retry-After vem em segundos ("120") ou como data HTTP; devolve segundos ou None
+    valor = resposta.headers.get("Retry-After")
+    if not valor: return None
+    try: segundos = float(valor)
+    except ValueError:
+        try: segundos = parsedate_to_datetime(valor).timestamp() - time.time()
+        except (TypeError, ValueError): return None
+    return min(RETRY_AFTER_TETO, max(0.0, segundos))
+
+
+class BaldeDeFichas:
+    # Token bucket: enche "taxa" fichas por segundo até "capacidade"; cada requisição gasta uma.
+    def __init__(self, taxa, capacidade=None):
+        self.taxa = float(taxa)
+        self.capacidade = float(capacidade or max(1, taxa))
+        self.fichas = self.capacidade
+        self.ultimo = time.monotonic()
+        self.trava = threading.Lock()
+
+    def pegar(self):
+        # Bloqueia até ter uma ficha disponível
+        while True:
+            with self.trava:
+                agora = time.monotonic()
+                self.fichas = min(self.capacidade, self.fichas + (agora - self.ultimo) * self.taxa)
+                self.ultimo = agora
+                if self.fichas >= 1:
+                    self.fichas -= 1
+                    return
+                falta = (1 - self.fichas) / self.taxa
+            time.sleep(falta)
+
+
+class ControleHost:
+    # Concorrência AIMD + circuit breaker + pausa do Retry-After de um host
+    def __init__(self, host, maximo, inicial=CONCORRENCIA_INICIAL):
+        self.host = host
+        self.maximo = max(1, maximo)
+        self.limite = float(min(inicial, self.maximo))
+        self.em_uso = 0
+        self.pausa_ate = 0.0
+        self.estado = "fechado"  # "fechado" (normal), "aberto" (recusando) ou "meio_aberto" (uma de teste)
+        self.aberto_ate = 0.0
+        self.falhas_seguidas = 0
+        self.em_teste = False
+        self.teste_falhou = False  # o teste do meio-aberto falhou: host fora mesmo, não adianta esperar
+        self.condicao = threading.Condition()
+
+    def entrar(self, espera_maxima=ESPERA_CIRCUITO):
+        # Bloqueia até ter vaga no host. Com o circuito aberto, espera (até espera_maxima) a
+        # requisição de teste; só levanta CircuitoAberto se o teste falhar ou a espera estourar.
+        desistir_em = time.monotonic() + espera_maxima
+        with self.condicao:
+            while True:
+                agora = time.monotonic()
+                if self.estado == "aberto":
+                    if agora < self.aberto_ate:
+                        if self.teste_falhou or self.aberto_ate > desistir_em:
+                            raise CircuitoAberto(f"Circuito aberto para {self.host} por mais {self.aberto_ate - agora:.0f}s")
+                        self.condicao.wait(self.aberto_ate - agora)
+                        continue
+                    self.estado = "meio_aberto"
+                    self.em_teste = False
+                if self.estado == "meio_aberto":
+                    # Só uma requisição de teste por vez; as outras esperam o resultado dela
+                    if not self.em_teste and self.em_uso == 0:
+                        self.em_teste = True
+                        break
+                    if agora >= desistir_em:
+                        raise CircuitoAberto(f"Circuito de {self.host} ainda em teste depois de {espera_maxima:.0f}s de espera")
+                elif agora < self.pausa_ate:
+                    self.condicao.wait(self.pausa_ate - agora)
+                    continue
+                elif self.em_uso < int(self.limite):
+                    break
+                self.condicao.wait(1)
+            self.em_uso += 1
+
+    def sair(self, resultado, latencia=0.0, retry_after=None):
+        # resultado: "ok", "throttling" (429, 503 com Retry-After), "falha" (5xx/conexão/timeout) ou "neutro"
+        with self.condicao:
+            janela_cheia = self.em_uso >= int(self.limite)  # só cresce se o limite estava sendo usado
+            self.em_uso -= 1
+            if retry_after: self.pausa_ate = max(self.pausa_ate, time.monotonic() + retry_after)
+
+            if resultado in ("ok", "throttling"):
+                # O host respondeu: throttling é resolvido pela pausa do Retry-After e pela
+                # diminuição abaixo, não pelo circuito
+                self.falhas_seguidas = 0
+                self.teste_falhou = False
+                if self.estado != "fechado":
+                    print(f"🔌 {self.host} respondeu de novo, circuito fechado.")
+                    self.estado = "fechado"
+            if resultado == "ok":
+                # Aumento aditivo: +1 a cada "limite" respostas rápidas (~ +1 por rodada de requisições)
+                if janela_cheia and latencia < LATENCIA_SAUDAVEL: self.limite = min(self.maximo, self.limite + 1 / self.limite)
+            elif resultado in ("throttling", "falha"):
+                # Diminuição multiplicativa
+                self.limite = max(1.0, self.limite / 2)
+            if resultado == "falha":
+                self.falhas_seguidas += 1
+                if self.estado == "meio_aberto" or self.falhas_seguidas >= FALHAS_PARA_ABRIR:
+                    if self.estado != "aberto":
+                        print(f"🔌 {self.host}: {self.falhas_seguidas} falhas seguidas, pausando por {TEMPO_CIRCUITO_ABERTO}s.")
+                        METRICAS.contar("http_circuito_aberto_total", host=self.host)
+                    self.teste_falhou = self.estado == "meio_aberto"
+                    self.estado = "aberto"
+                    self.aberto_ate = time.monotonic() + TEMPO_CIRCUITO_ABERTO
+            if self.estado == "meio_aberto": self.em_teste = False
+            self.condicao.notify_all()
+
+
+class ClienteHTTP:
+    def __init__(self, req_por_segundo=4, max_conexoes=10, headers=None, cache=None, max_tentativas=MAX_TENTATIVAS):
+        self.req_por_segundo = req_por_segundo
+        self.max_conexoes = max_conexoes
+        self.max_tentativas = max_tentativas
+        self.cache = cache
+        self.sessao = requests.Session()
+        # pool_maxsize >= nº de workers, senão as threads descartam conexões e o keep-alive se perde
+        adaptador = HTTPAdapter(pool_connections=max_conexoes, pool_maxsize=max_conexoes)
+        self.sessao.mount("http://", adaptador)
+        self.sessao.mount("https://", adaptador)
+        self.sessao.headers.update(headers or HEADERS_NAVEGADOR)
+        self.baldes = {}
+        self.controles = {}
+        self.trava = threading.Lock()
+
+    def balde(self, host):
+        with self.trava:
+            if host not in self.baldes:
+                self.baldes[host] = BaldeDeFichas(self.req_por_segundo)
+            return self.baldes[host]
+
+    def controle(self, host):
+        with self.trava:
+            if host not in self.controles:
+                self.controles[host] = ControleHost(host, self.max_conexoes)
+            return self.controles[host]
+
+    def get(self, url, ttl=None, **kwargs):
+        # Com cache: entrada fresca não vai à rede; vencida é revalidada com ETag/Last-Modified
+        host = urlparse(url).netloc
+        entrada = self.cache.ler(url) if self.cache else None
+        if entrada and self.cache.esta_fresca(entrada, ttl):
+            METRICAS.contar("http_cache_total", host=host, resultado="fresca")
+            return self.cache.como_resposta(url, entrada)
+
+        if entrada:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **self.cache.headers_condicionais(entrada)}
+
+        resposta = self.buscar_com_retentativas(url, host, **kwargs)
+
+        if entrada and resposta.status_code == 304:
+            METRICAS.contar("http_cache_total", host=host, resultado="revalidada")
+            self.cache.renovar(url)
+            return self.cache.como_resposta(url, entrada)
+        if self.cache and resposta.status_code == 200:
+            self.cache.salvar(url, resposta)
+        return resposta
+
+
+    def buscar_com_retentativas(self, url, host, **kwargs):
+        # Devolve a primeira resposta boa; esgotadas as tentativas, a última resposta (ex: 503)
+        # ou a última exceção (timeout, conexão) segue para quem chamou
+        controle = self.controle(host)
+        for tentativa in range(self.max_tentativas):
+            ultima = tentativa == self.max_tentativas - 1
+            controle.entrar()
+            self.balde(host).pegar()
+            inicio = time.perf_counter()
+            try:
+                resposta = self.sessao.get(url, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                controle.sair("falha", time.perf_counter() - inicio)
+                METRICAS.contar("http_erros_total", host=host, tipo=type(e).__name__)
+                if ultima: raise
+                METRICAS.contar("http_retentativas_total", host=host, motivo=type(e).__name__)
+                time.sleep(espera_backoff(tentativa))
+                continue
+            except Exception as e:
+                # Erro que não adianta repetir (URL inválida etc.)
+                controle.sair("neutro")
+                METRICAS.contar("http_erros_total", host=host, tipo=type(e).__name__)
+                raise
+
+            latencia = time.perf_counter() - inicio
+            METRICAS.observar("http_segundos", latencia, host=host)
+            METRICAS.contar("http_respostas_total", host=host, status=resposta.status_code)
+            METRICAS.contar("http_bytes_total", len(resposta.content), host=host)
+
+            if resposta.status_code not in STATUS_RETENTAVEIS:
+                controle.sair("ok", latencia)
+                return resposta
+
+            retry_after = ler_retry_after(resposta)
+            throttling = resposta.status_code in STATUS_THROTTLING and (resposta.status_code == 429 or retry_after is not None)
+            controle.sair("throttling" if throttling else "falha", latencia, retry_after)
+            if ultima: return resposta
+            METRICAS.contar("http_retentativas_total", host=host, motivo=str(resposta.status_code))
+            # Com Retry-After o próprio controle do host segura todas as threads; aqui só o backoff
+            time.sleep(espera_backoff(tentativa))
+        return resposta
+
+
+def buscar_em_paralelo(funcao, itens, max_workers=8, ao_concluir=None):
+    # Roda funcao(item) para cada item com no máximo max_workers threads.
+    # Devolve os resultados NA ORDEM dos itens; ao_concluir(indice, resultado) é chamado
+    # (na thread principal) conforme cada um termina, útil para mostrar progresso.
+    itens = list(itens)
+    resultados = [None] * len(itens)
+    if not itens: return resultados
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(itens)))) as executor:
+        futuros = {executor.submit(funcao, item): i for i, item in enumerate(itens)}
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            resultados[i] = futuro.result()
+            if ao_concluir: ao_concluir(i, resultados[i])
+    return resultados
@@ -0,0 +1,174 @@
+# --- MOTOR DE CORRESPONDÊNCIA CPU/GPU x BENCHMARKS ---
+# Faz o mesmo que process.extractOne (thefuzz, scorer WRatio), mas:
+# 1. remove as buscas repetidas e guarda os resultados (memo),
+# 2. pontua todas as buscas novas contra o catálogo de uma vez só (rapidfuzz cdist, multi-core),
+# 3. com o índice de modelos, só pontua os candidatos que têm o mesmo número de modelo
+#    ("12650h", "7840hs", "4060"...), caindo para o catálogo inteiro quando nada bate.
+# Os limiares abaixo são os mesmos do 4-benchmark.py.
+import re
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from thefuzz import utils
+
+from metricas import METRICAS
+
+LIMIAR_CPU = 80          # nota > 80 para aceitar a CPU
+LIMIAR_GPU_LAPTOP = 80   # se "X Laptop GPU" der nota < 80, tenta só "X"
+LIMIAR_GPU = 75          # nota > 75 para aceitar a GPU
+
+
+def processar_escolha(texto):
+    # O extractOne do thefuzz passa tudo pelo full_process em modo ASCII antes do WRatio
+    return utils.full_process(texto, force_ascii=True)
+
+
+def processar_busca(texto):
+    # ...e a busca ainda recebe um full_process a mais antes disso
+    return processar_escolha(utils.full_process(texto))
+
+
+# Número de modelo: pedaço com 3+ dígitos seguidos, com ou sem sufixo (12450h, 7840hs, 4060, 780m, rx7600s)
+PADRAO_MODELO = re.compile(r"^[a-z]*(\d{3,})[a-z0-9]*$")
+
+
+# Palavras que marcam a variante de notebook no nome do benchmark (ex: "RTX 4060 Laptop GPU")
+MARCADORES_NOTEBOOK = {"laptop", "mobile"}
+
+
+def tokens_modelo(texto_processado):
+    # Devolve [(token, numero)] de um texto já processado (minúsculo, só letras/números/espaços)
+    tokens = []
+    for palavra in texto_processado.split():
+        achado = PADRAO_MODELO.match(palavra)
+        if achado: tokens.append((palavra, achado.group(1)))
+    return tokens
+
+
+def montar_indice(nomes_processados):
+    # token exato -> índices e número "puro" -> índices (ex: "12450h" e "12450")
+    por_token, por_numero = {}, {}
+    for i, nome in enumerate(nomes_processados):
+        for token, numero in tokens_modelo(nome):
+            por_token.setdefault(token, set()).add(i)
+            por_numero.setdefault(numero, set()).add(i)
+    return por_token, por_numero
+
+
+def limpar_busca_cpu(cpu_txt):
+    return cpu_txt.replace("Intel", "").replace("AMD", "").replace("Core", "").strip()
+
+
+def limpar_busca_gpu(gpu_txt):
+    return gpu_txt.replace("NVIDIA", "").replace("GeForce", "").replace("Dedicada", "").strip()
+
+
+class MotorCorrespondencia:
+    def __init__(self, catalogo, workers=-1, usar_indice=True):
+        # catalogo: {nome_limpo: score} (cpu_db / gpu_db)
+        self.catalogo = catalogo
+        self.nomes = list(catalogo.keys())
+        self.nomes_processados = [processar_escolha(n) for n in self.nomes]
+        self.workers = workers
+        self.usar_indice = usar_indice
+        self.por_token, self.por_numero = montar_indice(self.nomes_processados)
+        self.memo = {}
+
+    def candidatos(self, busca_processada):
+        # Índices do catálogo com o mesmo modelo exato (ex: "12450h"); senão, o mesmo número
+        # ("12450" pega 12450H e 12450HX); None = nada bateu, usar o catálogo inteiro
+        tokens = tokens_modelo(busca_processada)
+        for chave, indice in ((0, self.por_token), (1, self.por_numero)):
+            achados = set()
+            for token in tokens:
+                achados |= indice.get(token[chave], set())
+            if achados: break
+        else:
+            return None
+
+        # Busca de notebook ("laptop"/"mobile"): se houver variantes de notebook, descarta as de desktop
+        if MARCADORES_NOTEBOOK & set(busca_processada.split()):
+            de_notebook = {i for i in achados if MARCADORES_NOTEBOOK & set(self.nomes_processados[i].split())}
+            if de_notebook: achados = de_notebook
+        return sorted(achados)  # mantém a ordem do catálogo para o desempate
+
+    def casar_lote(self, buscas):
+        # Devolve [(nome, nota)] na ordem das buscas; nome é None se o catálogo estiver vazio
+        novas = list(dict.fromkeys(b for b in buscas if b not in self.memo))
+        if not novas: return [self.memo[b] for b in buscas]
+        if not self.nomes:
+            for b in novas: self.memo[b] = (None, 0)
+            return [self.memo[b] for b in buscas]
+
+        varredura_completa = []
+        for b in novas:
+            processada = processar_busca(b)
+            indices = self.candidatos(processada) if self.usar_indice else None
+            if indices is None:
+                varredura_completa.append((b, processada))
+                continue
+            # Poucos candidatos: extractOne direto na fatia é mais barato que montar matriz
+            _, nota, k = process.extractOne(
+                processada, [self.nomes_processados[i] for i in indices], scorer=fuzz.WRatio, processor=None
+            )
+            self.memo[b] = (self.nomes[indices[k]], int(round(nota)))
+
+        if varredura_completa:
+            # float64 para desempatar e arredondar exatamente como o extractOne
+            matriz = process.cdist(
+                [p for _, p in varredura_completa], self.nomes_processados,
+                scorer=fuzz.WRatio, dtype=np.float64, workers=self.workers,
+            )
+            melhores = matriz.argmax(axis=1)  # argmax pega o primeiro em caso de empate, igual ao extractOne
+            for (b, _), linha, j in zip(varredura_completa, matriz, melhores):
+                self.memo[b] = (self.nomes[j], int(round(float(linha[j]))))
+        return [self.memo[b] for b in buscas]
+
+    def casar(self, busca):
+        return self.casar_lote([busca])[0]
+
+
+def registrar_notas(tipo, textos, resultados, limiar):
+    # Distribuição das notas do melhor match e quantos notebooks casaram (um registro por linha)
+    notas = []
+    contagem = {"casou": 0, "sem_match": 0, "vazio": 0}
+    for t in textos:
+        if not t or t == "N/A":
+            contagem["vazio"] += 1
+            continue
+        nome, nota = resultados.get(t, (None, 0))
+        notas.append(nota)
+        contagem["casou" if nome is not None and nota > limiar else "sem_match"] += 1
+    METRICAS.observar_varios("match_nota", notas, tipo=tipo)
+    for resultado, qtd in contagem.items():
+        if qtd: METRICAS.contar("match_total", qtd, tipo=tipo, resultado=resultado)
+
+
+def scores_cpu(textos, motor):
+    # Score de benchmark para cada texto de CPU da planilha (0 se não achou)
+    validos = [t for t in textos if t and t != "N/A"]
+    resultados = dict(zip(validos, motor.casar_lote([limpar_busca_cpu(t) for t in validos])))
+    registrar_notas("cpu", textos, resultados, LIMIAR_CPU)
+    scores = []
+    for t in textos:
+        nome, nota = resultados.get(t, (None, 0))
+        scores.append(motor.catalogo[nome] if nome is not None and nota > LIMIAR_CPU else 0)
+    return scores
+
+
+def scores_gpu(textos, motor):
+    # Primeiro tenta "X Laptop GPU"; se a nota ficar abaixo de 80, tenta só "X"
+    validos = list(dict.fromkeys(t for t in textos if t and t != "N/A"))
+    buscas = [limpar_busca_gpu(t) for t in validos]
+    resultados = dict(zip(validos, motor.casar_lote([b + " Laptop GPU" for b in buscas])))
+
+    refazer = [(t, b) for t, b in zip(validos, buscas) if resultados[t][1] < LIMIAR_GPU_LAPTOP]
+    for (t, _), res in zip(refazer, motor.casar_lote([b for _, b in refazer])):
+        resultados[t] = res
+
+    registrar_notas("gpu", textos, resultados, LIMIAR_GPU)
+    scores = []
+    for t in textos:
+        nome, nota = resultados.get(t, (None, 0))
+        scores.append(motor.catalogo[nome] if nome is not None and nota > LIMIAR_GPU else 0)
+    return scores
@@ -0,0 +1,56 @@
+# --- PREÇO E CUSTO-BENEFÍCIO EM COLUNAS (PANDAS) ---
+# Mesmas regras do loop antigo do 4-benchmark.py, só que aplicadas na coluna inteira de uma vez:
+# - preço "R$ 3.529,99" -> 3529.99; qualquer coisa que não vire número -> 0.0
+# - preço <= 100 é inválido: zera o preço exibido e todos os CBs
+# - CB = (pontos / preço) * 1000, arredondado em 2 casas
+import pandas as pd
+
+PRECO_MINIMO = 100
+
+# Nome da coluna -> (peso CPU, peso GPU). Dá para calcular vários perfis na mesma passada,
+# ex: {"Custo-Benefício Total": (0.4, 0.6), "CB Jogos": (0.2, 0.8)}
+PERFIS_PESO = {"Custo-Benefício Total": (0.4, 0.6)}
+
+
+def converter_precos(serie):
+    # Textos vindos da planilha passam pela limpeza BR; números (ex: direto do scraper) só viram float
+    serie = pd.Series(serie, dtype=object)
+    eh_texto = serie.map(lambda v: isinstance(v, str))
+
+    # Remove R$, pontos e troca vírgula por ponto; depois tira o que não for dígito ou ponto
+    texto = (
+        serie[eh_texto].str.replace("R$", "", regex=False)
+        .str.replace(".", "", regex=False)
+        .str.replace(",", ".", regex=False)
+        .str.replace(r"[^\d.]", "", regex=True)
+    )
+    precos = pd.Series(0.0, index=serie.index)
+    precos[eh_texto] = pd.to_numeric(texto, errors="coerce")
+    precos[~eh_texto] = pd.to_numeric(serie[~eh_texto], errors="coerce")
+    return precos.fillna(0.0).astype(float)
+
+
+def arredondar(serie):
+    # round() do Python e não np.round: o np.round arredonda diferente em alguns casos de x.xx5
+    # e o resultado precisa bater com o que o script sempre gravou
+    return pd.Series([round(v, 2) for v in serie.tolist()], index=serie.index, dtype=float)
+
+
+def calcular_custo_beneficio(precos, score_cpu, score_gpu, perfis=PERFIS_PESO):
+    # Devolve um DataFrame com "Preço" (0 se inválido), "CB CPU", "CB GPU" e uma coluna por perfil
+    precos = pd.Series(precos, dtype=float).reset_index(drop=True)
+    score_cpu = pd.Series(score_cpu, dtype=float).reset_index(drop=True)
+    score_gpu = pd.Series(score_gpu, dtype=float).reset_index(drop=True)
+
+    # Se o preço for menor que 100 (ex: 0, 1, ou muito baixo), consideramos inválido para cálculo
+    valido = precos > PRECO_MINIMO
+    divisor = precos.where(valido, 1.0)  # evita divisão por zero; as linhas inválidas são zeradas abaixo
+
+    resultado = pd.DataFrame({"Preço": precos.where(valido, 0.0)})
+    colunas = {"CB CPU": score_cpu, "CB GPU": score_gpu}
+    for nome, (peso_cpu, peso_gpu) in perfis.items():
+        colunas[nome] = (score_cpu * peso_cpu) + (score_gpu * peso_gpu)
+
+    for nome, pontos in colunas.items():
+        resultado[nome] = arredondar((pontos / divisor) * 1000).where(valido, 0.0)
+    return resultado
@@ -0,0 +1,145 @@
+# --- MODO INCREMENTAL ---
+# Guarda, por Link, uma "impressão digital" dos campos de specs raspados (Modelo, CPU, GPU, RAM)
+# junto com os scores de benchmark e os detalhes de RAM já calculados. Na rodada seguinte, quem
+# não mudou reaproveita tudo isso: só os CBs (que dependem do preço) são recalculados.
+# Mudanças de preço e cupom vão para um histórico que só recebe inserções.
+import hashlib
+import json
+import sqlite3
+import time
+
+import pandas as pd
+
+from ram import COLUNAS_RAM
+
+CAMINHO_ESTADO = "incremental.sqlite"
+CAMPOS_SPECS = ["Modelo", "CPU", "GPU", "RAM"]
+
+
+def impressao_digital(linha):
+    # Hash dos campos de specs; preço e cupom ficam de fora de propósito
+    return hashlib.sha1(json.dumps([str(linha[c]) for c in CAMPOS_SPECS]).encode("utf-8")).hexdigest()
+
+
+class EstadoIncremental:
+    def __init__(self, caminho=CAMINHO_ESTADO):
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.executescript("""
+            CREATE TABLE IF NOT EXISTS specs (
+                link TEXT PRIMARY KEY,
+                impressao TEXT,
+                snapshot_id INTEGER,
+                score_cpu INTEGER,
+                score_gpu INTEGER,
+                ram TEXT,
+                atualizado_em REAL
+            );
+            CREATE TABLE IF NOT EXISTS historico_precos (
+                link TEXT,
+                preco REAL,
+                cupom TEXT,
+                visto_em REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_historico_link ON historico_precos (link);
+        """)
+
+    def carregar(self):
+        # {link: {"impressao", "snapshot_id", "score_cpu", "score_gpu", "ram"}}
+        estado = {}
+        for link, impressao, snapshot_id, score_cpu, score_gpu, ram in self.conexao.execute(
+            "SELECT link, impressao, snapshot_id, score_cpu, score_gpu, ram FROM specs"
+        ):
+            estado[link] = {
+                "impressao": impressao, "snapshot_id": snapshot_id, "score_cpu": score_cpu,
+                "score_gpu": score_gpu, "ram": json.loads(ram) if ram else None,
+            }
+        return estado
+
+    def inalterados(self, df, estado=None):
+        # Série booleana: True onde o Link já é conhecido e as specs raspadas são as mesmas
+        estado = self.carregar() if estado is None else estado
+        return pd.Series(
+            [row["Link"] in estado and estado[row["Link"]]["impressao"] == impressao_digital(row) for _, row in df.iterrows()],
+            index=df.index, dtype=bool,
+        )
+
+    def scores_conhecidos(self, df, snapshot_id):
+        # DataFrame (índice = Link) com os scores reaproveitáveis: specs iguais e mesmo snapshot de benchmark
+        estado = self.carregar()
+        iguais = self.inalterados(df, estado)
+        linhas = {
+            link: {"Score CPU": estado[link]["score_cpu"], "Score GPU": estado[link]["score_gpu"]}
+            for link in df.loc[iguais, "Link"]
+            if snapshot_id is not None and estado[link]["snapshot_id"] == snapshot_id and estado[link]["score_cpu"] is not None
+        }
+        return pd.DataFrame.from_dict(linhas, orient="index", columns=["Score CPU", "Score GPU"])
+
+    def ram_conhecida(self, df):
+        # DataFrame (índice = Link) com as colunas de RAM reaproveitáveis
+        estado = self.carregar()
+        iguais = self.inalterados(df, estado)
+        linhas = {link: estado[link]["ram"] for link in df.loc[iguais, "Link"] if estado[link]["ram"]}
+        return pd.DataFrame.from_dict(linhas, orient="index", columns=COLUNAS_RAM)
+
+    def salvar(self, df):
+        # Atualiza o estado com o resultado da rodada. Se as specs mudaram, o que estava salvo
+        # para aquele Link é descartado; se não, só os campos presentes no df são atualizados.
+        estado = self.carregar()
+        snapshot_id = df.attrs.get("snapshot_benchmarks")
+        tem_scores = "Score CPU" in df.columns and "Score GPU" in df.columns
+        tem_ram = all(c in df.columns for c in COLUNAS_RAM)
+        ram_falhas = set(df.attrs.get("ram_falhas", []))
+        agora = time.time()
+
+        registros = []
+        for _, row in df.iterrows():
+            link = row["Link"]
+            if not link: continue
+            impressao = impressao_digital(row)
+            anterior = estado.get(link)
+            if not anterior or anterior["impressao"] != impressao:
+                anterior = {"snapshot_id": None, "score_cpu": None, "score_gpu": None, "ram": None}
+            if tem_scores:
+                anterior.update(snapshot_id=snapshot_id, score_cpu=int(row["Score CPU"]), score_gpu=int(row["Score GPU"]))
+            if tem_ram and link not in ram_falhas:
+                anterior["ram"] = {c: row[c] for c in COLUNAS_RAM}
+            registros.append((
+                link, impressao, anterior["snapshot_id"], anterior["score_cpu"], anterior["score_gpu"],
+                json.dumps(anterior["ram"], ensure_ascii=False) if anterior["ram"] else None, agora,
+            ))
+
+        with self.conexao:
+            self.conexao.executemany("INSERT OR REPLACE INTO specs VALUES (?, ?, ?, ?, ?, ?, ?)", registros)
+        return len(registros)
+
+    def registrar_precos(self, df):
+        # Acrescenta ao histórico só os Links cujo preço ou cupom mudou desde o último registro
+        ultimos = {
+            link: (preco, cupom) for link, preco, cupom in self.conexao.execute("""
+                SELECT link, preco, cupom FROM historico_precos
+                WHERE rowid IN (SELECT MAX(rowid) FROM historico_precos GROUP BY link)
+            """)
+        }
+        agora = time.time()
+        novos = []
+        for link, preco, cupom in zip(df["Link"], df["Preço"], df["Cupom"]):
+            if not link: continue
+            try: preco = float(preco)
+            except (TypeError, ValueError): preco = None
+            if ultimos.get(link) != (preco, cupom):
+                novos.append((link, preco, cupom, agora))
+                ultimos[link] = (preco, cupom)
+
+        with self.conexao:
+            self.conexao.executemany("INSERT INTO historico_precos VALUES (?, ?, ?, ?)", novos)
+        return len(novos)
+
+    def historico(self, link=None):
+        consulta = "SELECT link, preco, cupom, visto_em FROM historico_precos"
+        parametros = ()
+        if link:
+            consulta += " WHERE link = ?"
+            parametros = (link,)
+        historico = pd.read_sql_query(consulta + " ORDER BY rowid", self.conexao, params=parametros)
+        historico["visto_em"] = pd.to_datetime(historico["visto_em"], unit="s")
+        return historico
@@ -0,0 +1,26 @@
+# --- PARSE DE HTML SÓ DO TRECHO QUE INTERESSA ---
+# As páginas do PassMark e de cada notebook são grandes, mas o código só lê ul.chartlist e
+# div.spec-row.ram. Aqui só esse pedaço vira árvore do BeautifulSoup (SoupStrainer), e com o
+# parser em C do lxml quando ele está instalado (no Colab já vem). O resto da página é pulado
+# pelo parser sem criar objeto nenhum: menos CPU e menos memória por worker.
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # só para saber se está instalado
+    PARSER_HTML = "lxml"
+except ImportError:
+    PARSER_HTML = "html.parser"
+
+
+def tem_classe(classe):
+    # Durante o parse o atributo ainda é o texto cru ("spec-row ram"), e class_="spec-row" não
+    # bateria com ele; conforme a versão do bs4 pode chegar já separado em lista
+    def testar(valor):
+        if valor is None: return False
+        return classe in (valor if isinstance(valor, list) else str(valor).split())
+    return testar
+
+
+def ler_trecho(html, tag, classe, parser=None):
+    # Devolve um BeautifulSoup contendo só as <tag> que têm a classe (com tudo que está dentro)
+    return BeautifulSoup(html, parser or PARSER_HTML, parse_only=SoupStrainer(tag, class_=tem_classe(classe)))
@@ -0,0 +1,202 @@
+# --- MÉTRICAS DA EXECUÇÃO ---
+# Contadores e histogramas compartilhados por todos os módulos (um registro global, METRICAS,
+# seguro para threads). No fim da rodada exportar_metricas() grava:
+#   metricas/execucao.json  -> relatório com tudo (inclui p50/p95/máx de cada histograma)
+#   metricas/notebooks.prom -> formato texto do Prometheus (node_exporter --collector.textfile)
+# Com isso dá para ver se uma rodada lenta foi o Chrome, a rede, o parse ou o Sheets.
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PASTA_METRICAS = "metricas"
+PREFIXO = "notebooks_"
+
+# Limites dos buckets (segundos para latência, 0-100 para nota de match)
+LIMITES_SEGUNDOS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+LIMITES_NOTA = (10, 20, 30, 40, 50, 60, 70, 75, 80, 85, 90, 95, 100)
+
+DESCRICOES = {
+    "etapa_segundos": ("histogram", "Duração de cada etapa do pipeline", LIMITES_SEGUNDOS),
+    "http_segundos": ("histogram", "Latência de cada requisição HTTP que foi à rede", LIMITES_SEGUNDOS),
+    "http_respostas_total": ("counter", "Respostas HTTP por host e status", None),
+    "http_bytes_total": ("counter", "Bytes recebidos por host", None),
+    "http_erros_total": ("counter", "Requisições que falharam sem resposta (timeout, conexão...)", None),
+    "http_retentativas_total": ("counter", "Requisições refeitas depois de falha ou throttling", None),
+    "http_circuito_aberto_total": ("counter", "Vezes que um host foi pausado pelo circuit breaker", None),
+    "http_cache_total": ("counter", "Respostas servidas pelo cache local (fresca ou revalidada)", None),
+    "chrome_pagina_segundos": ("histogram", "Abrir e esperar cada página da listagem no Chrome", LIMITES_SEGUNDOS),
+    "cards_lidos_total": ("counter", "Cards de notebook extraídos da listagem", None),
+    "cards_descartados_total": ("counter", "Cards descartados, por motivo", None),
+    "paginas_listagem_total": ("counter", "Páginas da listagem por modo (http ou selenium) e motivo do fallback", None),
+    "cards_sem_preco_total": ("counter", "Cards aceitos sem preço na listagem HTTP (fora de estoque), por consulta", None),
+    "cards_por_consulta_total": ("counter", "Cards lidos em cada consulta (antes de juntar pelo Link)", None),
+    "cards_em_outra_consulta_total": ("counter", "Cards repetidos que vieram de outra consulta (juntados pelo Link)", None),
+    "paginas_com_erro_total": ("counter", "Páginas da listagem que falharam inteiras", None),
+    "ram_falhas_total": ("counter", "Páginas de produto sem detalhes de RAM, por motivo", None),
+    "specs_descartadas_total": ("counter", "Campos de RAM que não puderam ser lidos, por campo", None),
+    "chart_linhas_descartadas_total": ("counter", "Linhas do PassMark ignoradas no parse, por tabela", None),
+    "match_nota": ("histogram", "Nota do melhor match de CPU/GPU (0-100)", LIMITES_NOTA),
+    "match_total": ("counter", "Textos de CPU/GPU por resultado do casamento", None),
+    "planilha_alteracoes_total": ("counter", "Células/linhas gravadas na planilha, por tipo", None),
+}
+
+
+def chave_rotulos(rotulos):
+    return tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+
+
+def percentil(valores, p):
+    if not valores: return None
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p * (len(ordenados) - 1))))]
+
+
+def escapar_rotulo(valor):
+    # Formato texto do Prometheus: \\ primeiro (senão escaparia o escape dos outros), depois " e quebra de linha
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histograma:
+    def __init__(self, limites):
+        self.limites = tuple(limites)
+        self.buckets = [0] * len(self.limites)
+        self.valores = []
+
+    def observar(self, valor):
+        self.valores.append(valor)
+        for i, limite in enumerate(self.limites):
+            if valor <= limite:
+                self.buckets[i] += 1
+                break
+
+    def resumo(self):
+        # Buckets cumulativos, como o Prometheus espera
+        acumulado, cumulativos = 0, []
+        for limite, qtd in zip(self.limites, self.buckets):
+            acumulado += qtd
+            cumulativos.append([limite, acumulado])
+        return {
+            "contagem": len(self.valores), "soma": sum(self.valores),
+            "p50": percentil(self.valores, 0.5), "p95": percentil(self.valores, 0.95),
+            "max": max(self.valores) if self.valores else None, "buckets": cumulativos,
+        }
+
+
+class Metricas:
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        with self.trava:
+            self.inicio = time.time()
+            self.contadores = {}
+            self.histogramas = {}
+
+    def contar(self, nome, incremento=1, **rotulos):
+        with self.trava:
+            chave = (nome, chave_rotulos(rotulos))
+            self.contadores[chave] = self.contadores.get(chave, 0) + incremento
+
+    def observar(self, nome, valor, **rotulos):
+        self.observar_varios(nome, [valor], **rotulos)
+
+    def observar_varios(self, nome, valores, **rotulos):
+        # Vários valores com uma trava só (ex: a nota de cada linha de um lote de match)
+        limites = DESCRICOES.get(nome, (None, None, LIMITES_SEGUNDOS))[2]
+        with self.trava:
+            chave = (nome, chave_rotulos(rotulos))
+            if chave not in self.histogramas: self.histogramas[chave] = Histograma(limites)
+            for valor in valores:
+                self.histogramas[chave].observar(valor)
+
+    @contextmanager
+    def cronometro(self, nome, **rotulos):
+        inicio = time.perf_counter()
+        try: yield
+        finally: self.observar(nome, time.perf_counter() - inicio, **rotulos)
+
+    def total(self, nome, **filtro):
+        # Soma de um contador em todos os rótulos (ou só nos que batem com o filtro)
+        alvo = set(chave_rotulos(filtro))
+        with self.trava:
+            return sum(v for (n, r), v in self.contadores.items() if n == nome and alvo <= set(r))
+
+    def relatorio(self):
+        with self.trava:
+            return {
+                "inicio": self.inicio,
+                "fim": time.time(),
+                "contadores": [
+                    {"nome": nome, "rotulos": dict(rotulos), "valor": valor}
+                    for (nome, rotulos), valor in sorted(self.contadores.items())
+                ],
+                "histogramas": [
+                    {"nome": nome, "rotulos": dict(rotulos), **hist.resumo()}
+                    for (nome, rotulos), hist in sorted(self.histogramas.items(), key=lambda item: item[0])
+                ],
+            }
+
+    def prometheus(self):
+        relatorio = self.relatorio()
+        formatar = lambda rotulos: "{" + ",".join(f'{k}="{escapar_rotulo(v)}"' for k, v in rotulos.items()) + "}" if rotulos else ""
+        linhas, cabecalhos = [], set()
+
+        def cabecalho(nome, tipo):
+            if nome in cabecalhos: return
+            cabecalhos.add(nome)
+            linhas.append(f"# HELP {PREFIXO}{nome} {DESCRICOES.get(nome, (None, nome))[1]}")
+            linhas.append(f"# TYPE {PREFIXO}{nome} {tipo}")
+
+        for c in relatorio["contadores"]:
+            cabecalho(c["nome"], "counter")
+            linhas.append(f"{PREFIXO}{c['nome']}{formatar(c['rotulos'])} {c['valor']}")
+        for h in relatorio["histogramas"]:
+            cabecalho(h["nome"], "histogram")
+            for limite, acumulado in h["buckets"]:
+                linhas.append(f"{PREFIXO}{h['nome']}_bucket{formatar({**h['rotulos'], 'le': limite})} {acumulado}")
+            linhas.append(f"{PREFIXO}{h['nome']}_bucket{formatar({**h['rotulos'], 'le': '+Inf'})} {h['contagem']}")
+            linhas.append(f"{PREFIXO}{h['nome']}_sum{formatar(h['rotulos'])} {h['soma']}")
+            linhas.append(f"{PREFIXO}{h['nome']}_count{formatar(h['rotulos'])} {h['contagem']}")
+        linhas.append(f"# TYPE {PREFIXO}ultima_execucao_timestamp gauge")
+        linhas.append(f"{PREFIXO}ultima_execucao_timestamp {relatorio['fim']:.0f}")
+        return "\n".join(linhas) + "\n"
+
+
+METRICAS = Metricas()
+
+
+def gravar_atomico(caminho, conteudo):
+    # O coletor do node_exporter pode ler no meio da escrita: grava num temporário e troca
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+def resumo_metricas(metricas=METRICAS):
+    # Uma linha por área, para o fim da célula
+    relatorio = metricas.relatorio()
+    etapas = {h["rotulos"].get("etapa"): h["soma"] for h in relatorio["histogramas"] if h["nome"] == "etapa_segundos"}
+    http = [h for h in relatorio["histogramas"] if h["nome"] == "http_segundos"]
+    n_http = sum(h["contagem"] for h in http)
+    p95_http = max((h["p95"] for h in http if h["p95"] is not None), default=0)
+    descartes = {c["rotulos"].get("motivo"): c["valor"] for c in relatorio["contadores"] if c["nome"] == "cards_descartados_total"}
+    casou = metricas.total("match_total", resultado="casou")
+    tentativas = metricas.total("match_total")
+
+    if etapas: print("📊 Etapas: " + " | ".join(f"{nome} {t:.1f}s" for nome, t in etapas.items()))
+    print(f"📊 HTTP: {n_http} requisições (p95 {p95_http:.2f}s), {metricas.total('http_erros_total')} erros, "
+          f"{metricas.total('http_retentativas_total')} retentativas, {metricas.total('http_cache_total')} do cache")
+    print(f"📊 Cards: {metricas.total('cards_lidos_total')} lidos, descartados {descartes or 0}")
+    if tentativas: print(f"📊 Match CPU/GPU: {casou}/{tentativas} textos casaram")
+
+
+def exportar_metricas(pasta=PASTA_METRICAS, metricas=METRICAS):
+    os.makedirs(pasta, exist_ok=True)
+    gravar_atomico(os.path.join(pasta, "execucao.json"), json.dumps(metricas.relatorio(), indent=2, ensure_ascii=False))
+    gravar_atomico(os.path.join(pasta, "notebooks.prom"), metricas.prometheus())
+    resumo_metricas(metricas)
+    print(f"📁 Métricas em {pasta}/execucao.json e {pasta}/notebooks.prom")
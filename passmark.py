@@ -0,0 +1,167 @@
+# --- TABELAS DE BENCHMARK (PASSMARK) ---
+# Download em paralelo das tabelas de CPU/GPU e um "snapshot" local em SQLite com a data de cada
+# download. Rodadas seguintes carregam o snapshot em milissegundos e só baixam de novo quando ele
+# passou da idade máxima. Um snapshot antigo pode ser fixado para repontuar rodadas passadas.
+import sqlite3
+import time
+
+from cliente_http import ClienteHTTP, buscar_em_paralelo
+from leitor_html import ler_trecho
+from metricas import METRICAS
+
+# (tipo, categoria, url) - a ordem importa: as de mid-range sobrescrevem as de high-end no dict final
+FONTES_BENCHMARK = [
+    ("CPU", "cpu", "https://www.cpubenchmark.net/high_end_cpus.html"),
+    ("CPU_MID", "cpu", "https://www.cpubenchmark.net/mid_range_cpus.html"),
+    ("GPU", "gpu", "https://www.videocardbenchmark.net/high_end_gpus.html"),
+    ("GPU_MID", "gpu", "https://www.videocardbenchmark.net/mid_range_gpus.html"),
+]
+
+CAMINHO_SNAPSHOTS = "benchmarks.sqlite"
+IDADE_MAXIMA_SNAPSHOT = 7 * 24 * 3600  # 7 dias: as tabelas do PassMark mudam devagar
+
+
+def baixar_tabela_benchmark_rapido(url, tipo="CPU", cliente=None):
+    print(f"📥 Baixando dados de {tipo}...")
+    cliente = cliente or ClienteHTTP()
+    try:
+        response = cliente.get(url, timeout=20)
+        if getattr(response, "do_cache", False): print(f"💾 {tipo} lido do cache local.")
+        # Só a ul.chartlist vira árvore (a página tem menus, tabelas e scripts que não interessam)
+        soup = ler_trecho(response.text, "ul", "chartlist")
+        dados = {}
+        rows = soup.select("ul.chartlist li")
+        for row in rows:
+            try:
+                nome = row.select_one("span.prdname").get_text(strip=True)
+                score = int(row.select_one("span.count").get_text(strip=True).replace(",", ""))
+                # Limpeza para facilitar o match
+                nome_limpo = nome.replace("Intel", "").replace("AMD", "").replace("NVIDIA", "").strip()
+                dados[nome_limpo] = score
+            except:
+                METRICAS.contar("chart_linhas_descartadas_total", tabela=tipo)
+                continue
+        print(f"✅ {len(dados)} {tipo}s carregados.")
+        return dados
+    except Exception as e:
+        # Tabela vazia não vira snapshot (ver obter_benchmarks), mas o motivo precisa aparecer
+        print(f"⚠️ Falha ao baixar {tipo} depois das retentativas: {e}")
+        return {}
+
+
+def baixar_todas(cliente=None, fontes=FONTES_BENCHMARK):
+    # Baixa todas as tabelas ao mesmo tempo. Devolve {tipo: {"url", "baixado_em", "dados"}}
+    cliente = cliente or ClienteHTTP()
+
+    def baixar(fonte):
+        tipo, _, url = fonte
+        dados = baixar_tabela_benchmark_rapido(url, tipo, cliente)
+        return {"url": url, "baixado_em": time.time(), "dados": dados}
+
+    resultados = buscar_em_paralelo(baixar, fontes, max_workers=len(fontes))
+    return {fonte[0]: resultado for fonte, resultado in zip(fontes, resultados)}
+
+
+def juntar_por_categoria(tabelas, fontes=FONTES_BENCHMARK):
+    # Monta cpu_db e gpu_db como o script sempre fez: high-end primeiro, depois update com mid-range
+    bancos = {"cpu": {}, "gpu": {}}
+    for tipo, categoria, _ in fontes:
+        if tipo in tabelas:
+            bancos[categoria].update(tabelas[tipo]["dados"])
+    return bancos["cpu"], bancos["gpu"]
+
+
+class SnapshotBenchmarks:
+    def __init__(self, caminho=CAMINHO_SNAPSHOTS):
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                criado_em REAL
+            );
+            CREATE TABLE IF NOT EXISTS tabelas (
+                snapshot_id INTEGER,
+                tipo TEXT,
+                url TEXT,
+                baixado_em REAL,
+                PRIMARY KEY (snapshot_id, tipo)
+            );
+            CREATE TABLE IF NOT EXISTS scores (
+                snapshot_id INTEGER,
+                tipo TEXT,
+                ordem INTEGER,
+                nome TEXT,
+                score INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_scores ON scores (snapshot_id, tipo, ordem);
+        """)
+
+    def salvar(self, tabelas):
+        # Cria uma nova versão com todas as tabelas e devolve o id
+        with self.conexao:
+            cursor = self.conexao.execute("INSERT INTO snapshots (criado_em) VALUES (?)", (time.time(),))
+            snapshot_id = cursor.lastrowid
+            for tipo, tabela in tabelas.items():
+                self.conexao.execute(
+                    "INSERT INTO tabelas VALUES (?, ?, ?, ?)",
+                    (snapshot_id, tipo, tabela["url"], tabela["baixado_em"]),
+                )
+                self.conexao.executemany(
+                    "INSERT INTO scores VALUES (?, ?, ?, ?, ?)",
+                    [(snapshot_id, tipo, i, nome, score) for i, (nome, score) in enumerate(tabela["dados"].items())],
+                )
+        return snapshot_id
+
+    def listar(self):
+        # [(id, criado_em)] do mais novo para o mais antigo
+        return self.conexao.execute("SELECT id, criado_em FROM snapshots ORDER BY id DESC").fetchall()
+
+    def ultimo(self):
+        linhas = self.listar()
+        return linhas[0] if linhas else None
+
+    def carregar(self, snapshot_id):
+        # Devolve {tipo: {"url", "baixado_em", "dados"}} no mesmo formato de baixar_todas
+        tabelas = {}
+        for tipo, url, baixado_em in self.conexao.execute(
+            "SELECT tipo, url, baixado_em FROM tabelas WHERE snapshot_id = ?", (snapshot_id,)
+        ):
+            linhas = self.conexao.execute(
+                "SELECT nome, score FROM scores WHERE snapshot_id = ? AND tipo = ? ORDER BY ordem",
+                (snapshot_id, tipo),
+            ).fetchall()
+            tabelas[tipo] = {"url": url, "baixado_em": baixado_em, "dados": dict(linhas)}
+        if not tabelas:
+            raise ValueError(f"Snapshot {snapshot_id} não encontrado.")
+        return tabelas
+
+
+def obter_benchmarks(idade_maxima=IDADE_MAXIMA_SNAPSHOT, snapshot_fixo=None, cliente=None, caminho=CAMINHO_SNAPSHOTS):
+    # Devolve (cpu_db, gpu_db, snapshot_id).
+    # snapshot_fixo: usa exatamente aquela versão (para repontuar rodadas antigas).
+    # Senão usa o último snapshot se for mais novo que idade_maxima; se não, baixa tudo e salva um novo.
+    store = SnapshotBenchmarks(caminho)
+
+    if snapshot_fixo is not None:
+        print(f"📌 Usando snapshot fixo #{snapshot_fixo}.")
+        return (*juntar_por_categoria(store.carregar(snapshot_fixo)), snapshot_fixo)
+
+    ultimo = store.ultimo()
+    if ultimo and time.time() - ultimo[1] < idade_maxima:
+        idade_h = (time.time() - ultimo[1]) / 3600
+        print(f"💾 Snapshot #{ultimo[0]} de benchmarks carregado ({idade_h:.1f}h de idade).")
+        return (*juntar_por_categoria(store.carregar(ultimo[0])), ultimo[0])
+
+    tabelas = baixar_todas(cliente)
+    vazias = [tipo for tipo, tabela in tabelas.items() if not tabela["dados"]]
+    if vazias:
+        # Download incompleto: não vira snapshot. Se existir um anterior, ele é melhor que nada.
+        print(f"⚠️ Tabelas vazias: {', '.join(vazias)}.")
+        if ultimo:
+            print(f"💾 Mantendo snapshot anterior #{ultimo[0]}.")
+            return (*juntar_por_categoria(store.carregar(ultimo[0])), ultimo[0])
+        return (*juntar_por_categoria(tabelas), None)
+
+    snapshot_id = store.salvar(tabelas)
+    print(f"🗂️ Snapshot #{snapshot_id} de benchmarks salvo.")
+    return (*juntar_por_categoria(tabelas), snapshot_id)
@@ -0,0 +1,152 @@
+# --- PIPELINE EM MEMÓRIA (SCRAPER -> BENCHMARK -> RAM -> PLANILHA) ---
+# As três etapas rodam num processo só sobre o mesmo DataFrame e a planilha é gravada UMA vez
+# no final. Cada etapa salva o resultado em intermediarios/<etapa>.pkl, então dá para refazer
+# só uma etapa (ex: só a de RAM) a partir do que a anterior deixou, sem raspar tudo de novo.
+import os
+import time
+
+import pandas as pd
+
+from cache_http import CacheHTTP
+from cliente_http import ClienteHTTP
+from correspondencia import MotorCorrespondencia, scores_cpu, scores_gpu
+from custo_beneficio import PERFIS_PESO, converter_precos, calcular_custo_beneficio
+from incremental import CAMINHO_ESTADO, EstadoIncremental
+from metricas import METRICAS, exportar_metricas
+from passmark import IDADE_MAXIMA_SNAPSHOT, obter_benchmarks
+from ram import enriquecer_ram
+from sincronizacao import sincronizar_planilha, FORMATO_PRECO
+
+ETAPAS = ["scraper", "benchmark", "ram"]
+PASTA_INTERMEDIARIOS = "intermediarios"
+
+
+def colunas_benchmark(perfis=PERFIS_PESO):
+    return ["Score CPU", "CB CPU", "Score GPU", "CB GPU"] + list(perfis.keys())
+
+
+def ler_tabela(worksheet):
+    # Aba inteira -> DataFrame (tudo como texto, do jeito que o get_all_values devolve)
+    rows = worksheet.get_all_values()
+    if not rows: return pd.DataFrame()
+    return pd.DataFrame(rows[1:], columns=rows[0])
+
+
+def tabela_para_linhas(df):
+    # DataFrame -> [cabeçalho] + linhas; astype(object) devolve int/float do Python para o gspread
+    return [list(df.columns)] + df.astype(object).values.tolist()
+
+
+# --- ETAPAS ---
+def etapa_scraper(consultas=None, num_workers=None):
+    # consultas: {nome: url}, uma URL só ou None (CONSULTAS de scraper.py)
+    # Import aqui dentro: refazer só benchmark/RAM não precisa de Selenium instalado
+    from scraper import COLUNAS_LISTAGEM
+    from scraper_http import raspar
+    return pd.DataFrame(raspar(consultas, num_workers), columns=COLUNAS_LISTAGEM)
+
+
+def etapa_benchmark(df, cpu_db=None, gpu_db=None, perfis=PERFIS_PESO, snapshot_fixo=None, cliente=None, estado=None):
+    # Score CPU/GPU + custo-benefício. Preço <= 100 zera o preço e os CBs (como sempre foi).
+    # estado (EstadoIncremental): links com as mesmas specs e o mesmo snapshot de benchmark
+    # reaproveitam os scores; só os CBs, que dependem do preço, são recalculados para todos.
+    snapshot_id = None
+    if cpu_db is None or gpu_db is None:
+        cliente = cliente or ClienteHTTP(cache=CacheHTTP())
+        cpu_db, gpu_db, snapshot_id = obter_benchmarks(IDADE_MAXIMA_SNAPSHOT, snapshot_fixo, cliente)
+
+    df = df.copy()
+    df.attrs["snapshot_benchmarks"] = snapshot_id
+    conhecidos = estado.scores_conhecidos(df, snapshot_id) if estado is not None else pd.DataFrame(columns=["Score CPU", "Score GPU"])
+    reaproveitar = df["Link"].isin(conhecidos.index)
+    casar = ~reaproveitar
+
+    print("\n🧩 Casando CPUs e GPUs com os benchmarks (em lote)...")
+    df["Score CPU"] = 0
+    df["Score GPU"] = 0
+    # CPU: nota > 80 | GPU: "Laptop GPU" primeiro, depois nota > 75
+    if casar.any():
+        df.loc[casar, "Score CPU"] = scores_cpu(df.loc[casar, "CPU"].tolist(), MotorCorrespondencia(cpu_db))
+        df.loc[casar, "Score GPU"] = scores_gpu(df.loc[casar, "GPU"].tolist(), MotorCorrespondencia(gpu_db))
+    if reaproveitar.any():
+        for coluna in ["Score CPU", "Score GPU"]:
+            df.loc[reaproveitar, coluna] = conhecidos.loc[df.loc[reaproveitar, "Link"], coluna].astype(int).values
+        print(f"♻️ {int(reaproveitar.sum())} notebooks com specs iguais à última rodada: scores reaproveitados.")
+    print(f"✅ {df.loc[casar, 'CPU'].nunique()} CPUs e {df.loc[casar, 'GPU'].nunique()} GPUs distintas pontuadas.")
+    return aplicar_custo_beneficio(df, perfis)
+
+
+def aplicar_custo_beneficio(df, perfis=PERFIS_PESO):
+    # CBs a partir de Preço/Score CPU/Score GPU (usado também pelo modo streaming)
+    cb = calcular_custo_beneficio(converter_precos(df["Preço"]), df["Score CPU"], df["Score GPU"], perfis)
+    for coluna in cb.columns:
+        df[coluna] = cb[coluna].values
+
+    # Reordena: colunas de benchmark logo depois das que já existiam
+    novas = colunas_benchmark(perfis)
+    return df[[c for c in df.columns if c not in novas] + novas]
+
+
+def etapa_ram(df, cliente=None, max_workers=None, estado=None):
+    print("\n🔍 Extraindo dados detalhados de RAM...")
+    reaproveitar = estado.ram_conhecida(df) if estado is not None else None
+    return enriquecer_ram(df, cliente, max_workers, reaproveitar)
+
+
+# --- EXECUÇÃO ---
+def caminho_intermediario(etapa, pasta=PASTA_INTERMEDIARIOS):
+    return os.path.join(pasta, f"{etapa}.pkl")
+
+
+def carregar_intermediario(etapa, pasta=PASTA_INTERMEDIARIOS):
+    caminho = caminho_intermediario(etapa, pasta)
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"❌ Intermediário da etapa '{etapa}' não encontrado ({caminho}). Rode essa etapa antes.")
+    return pd.read_pickle(caminho)
+
+
+def rodar_pipeline(worksheet=None, etapas=ETAPAS, pasta=PASTA_INTERMEDIARIOS, url_base=None, num_workers=None,
+                   perfis=PERFIS_PESO, snapshot_fixo=None, incremental=False, caminho_estado=CAMINHO_ESTADO, consultas=None):
+    # etapas: sequência contínua de ETAPAS (ex: ["ram"] ou ["benchmark", "ram"]).
+    # Se não começar pelo scraper, a entrada é o intermediário salvo pela etapa anterior.
+    # worksheet=None: não publica, só devolve o DataFrame (útil para testar).
+    # incremental=True: notebooks com as mesmas specs da última rodada não passam de novo pelo
+    # casamento de benchmark nem pela página de RAM; preço/cupom vão para o histórico.
+    # consultas: {nome: url} raspadas juntas (padrão CONSULTAS); url_base é o atalho para uma só.
+    etapas = list(etapas)
+    inicio_etapas = ETAPAS.index(etapas[0]) if etapas and etapas[0] in ETAPAS else -1
+    if inicio_etapas < 0 or etapas != ETAPAS[inicio_etapas:inicio_etapas + len(etapas)]:
+        raise ValueError(f"Etapas devem ser uma sequência contínua de {ETAPAS}, recebido {etapas}.")
+
+    df = carregar_intermediario(ETAPAS[inicio_etapas - 1], pasta) if inicio_etapas > 0 else None
+    if df is not None: print(f"💾 Entrada: intermediário de '{ETAPAS[inicio_etapas - 1]}' ({len(df)} linhas).")
+
+    os.makedirs(pasta, exist_ok=True)
+    estado = EstadoIncremental(caminho_estado) if incremental else None
+    METRICAS.zerar()
+    tempos = {}
+    for etapa in etapas:
+        print(f"\n▶️ Etapa {etapa}...")
+        inicio = time.time()
+        if etapa == "scraper": df = etapa_scraper(consultas or url_base, num_workers)
+        elif etapa == "benchmark":
+            # A entrada daqui é a saída crua do scraper: é o preço que vai para o histórico
+            if estado is not None: print(f"📈 {estado.registrar_precos(df)} mudanças de preço/cupom no histórico.")
+            df = etapa_benchmark(df, perfis=perfis, snapshot_fixo=snapshot_fixo, estado=estado)
+        elif etapa == "ram": df = etapa_ram(df, estado=estado)
+        tempos[etapa] = time.time() - inicio
+        METRICAS.observar("etapa_segundos", tempos[etapa], etapa=etapa)
+        df.to_pickle(caminho_intermediario(etapa, pasta))
+        print(f"⏱️ Etapa {etapa}: {tempos[etapa]:.1f}s ({len(df)} linhas)")
+
+    if estado is not None: estado.salvar(df)
+
+    if worksheet is not None:
+        print("\n💾 Publicando na planilha...")
+        inicio = time.time()
+        sincronizar_planilha(worksheet, tabela_para_linhas(df), formatos=FORMATO_PRECO)
+        tempos["planilha"] = time.time() - inicio
+
+    print("\n⏱️ Resumo: " + " | ".join(f"{nome} {t:.1f}s" for nome, t in tempos.items()))
+    exportar_metricas()
+    return df, tempos
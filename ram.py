@@ -0,0 +1,163 @@
+# --- DETALHES DE RAM (PÁGINA DE CADA NOTEBOOK) ---
+# Funções do 5-verifica-ram.py, importáveis pelo pipeline: baixa a página do produto e lê o
+# bloco div.spec-row.ram (geração, soldada, slots e máximo).
+from functools import partial
+
+import pandas as pd
+
+from cache_http import CacheHTTP
+from cliente_http import ClienteHTTP, buscar_em_paralelo
+from leitor_html import ler_trecho
+from metricas import METRICAS
+
+# Busca concorrente: MAX_WORKERS páginas ao mesmo tempo, no máximo REQ_POR_SEGUNDO por host
+# (MAX_WORKERS = 1 e REQ_POR_SEGUNDO = 2 equivalem ao loop antigo com sleep de 0.5s)
+MAX_WORKERS = 8
+REQ_POR_SEGUNDO = 4
+
+# Colunas NA ORDEM PEDIDA e a chave correspondente no dict de detalhes
+COLUNAS_RAM = ["Geração DDR", "RAM Soldada", "Slots Ativos", "Slot 1", "Slot 2", "RAM Máxima"]
+CHAVES_RAM = ["geracao", "soldada", "slots_qtd", "slot1_val", "slot2_val", "maximo"]
+
+
+def criar_cliente():
+    # Sessão única com keep-alive, compartilhada por todos os workers.
+    # Com o cache em disco, só links novos ou vencidos vão à rede numa reexecução.
+    return ClienteHTTP(req_por_segundo=REQ_POR_SEGUNDO, max_conexoes=MAX_WORKERS, cache=CacheHTTP())
+
+
+def extrair_detalhes_ram(url, cliente=None):
+    cliente = cliente or criar_cliente()
+    # Valores padrão
+    detalhes = {
+        "geracao": "N/A",
+        "soldada": "Check Manual",
+        "slots_qtd": "0",
+        "slot1_val": "N/A", # Novo
+        "slot2_val": "N/A", # Novo
+        "maximo": "N/A"
+    }
+
+    try:
+        response = cliente.get(url, timeout=15)
+        if response.status_code != 200:
+            METRICAS.contar("ram_falhas_total", motivo=f"http_{response.status_code}")
+            detalhes["erro"] = f"HTTP {response.status_code}"
+            return detalhes
+        
+        # Só os div.spec-row entram na árvore; o resto da página é pulado no parse
+        soup = ler_trecho(response.text, "div", "spec-row")
+        div_ram = soup.select_one("div.spec-row.ram")
+        
+        if not div_ram:
+            METRICAS.contar("ram_falhas_total", motivo="sem_bloco_ram")
+            return detalhes
+
+        # A. GERAÇÃO
+        try:
+            txt = div_ram.select_one(".spec_ram_installed_capacity_and_type").get_text()
+            if "DDR5" in txt: detalhes["geracao"] = "DDR5"
+            elif "DDR4" in txt: detalhes["geracao"] = "DDR4"
+            elif "LPDDR" in txt: detalhes["geracao"] = txt.split(" ")[1]
+            else: detalhes["geracao"] = txt
+        except: METRICAS.contar("specs_descartadas_total", campo="geracao")
+
+        # B. MÁXIMO
+        try:
+            txt = div_ram.select_one(".spec_ram_max_capacity").get_text()
+            detalhes["maximo"] = txt.lower().replace("máximo de", "").replace("máximo", "").strip()
+        except: METRICAS.contar("specs_descartadas_total", campo="maximo")
+
+        # C. SOLDADA
+        try:
+            li_soldada = div_ram.select_one(".spec_ram_onboard")
+            if li_soldada:
+                classes = li_soldada.get("class", [])
+                texto = li_soldada.get_text().lower()
+                if "not-available" in classes or "não possui" in texto:
+                    detalhes["soldada"] = "Não possui"
+                else:
+                    detalhes["soldada"] = "Sim"
+        except: METRICAS.contar("specs_descartadas_total", campo="soldada")
+
+        # D. SLOTS (CONTAGEM E CONTEÚDO)
+        try:
+            # --- Contagem de Ativos ---
+            lista_slots = div_ram.select("li[class^='spec_ram_slot_']")
+            slots_reais = 0
+            for slot in lista_slots:
+                classes = slot.get("class", [])
+                texto = slot.get_text().lower()
+                if "not-available" not in classes and "não possui" not in texto:
+                    slots_reais += 1
+            detalhes["slots_qtd"] = str(slots_reais)
+
+            # --- Detalhe Slot 1 ---
+            li_s1 = div_ram.select_one(".spec_ram_slot_1")
+            if li_s1:
+                if "not-available" in li_s1.get("class", []) or "não possui" in li_s1.get_text().lower():
+                    detalhes["slot1_val"] = "Vazio"
+                else:
+                    # Tenta pegar o negrito (ex: <b>8 GB</b>)
+                    b_tag = li_s1.select_one("b")
+                    if b_tag: detalhes["slot1_val"] = b_tag.get_text(strip=True)
+                    else: detalhes["slot1_val"] = li_s1.get_text().replace("Slot 1:", "").strip()
+            else:
+                detalhes["slot1_val"] = "N/A"
+
+            # --- Detalhe Slot 2 ---
+            li_s2 = div_ram.select_one(".spec_ram_slot_2")
+            if li_s2:
+                if "not-available" in li_s2.get("class", []) or "não possui" in li_s2.get_text().lower():
+                    detalhes["slot2_val"] = "Vazio"
+                else:
+                    b_tag = li_s2.select_one("b")
+                    if b_tag: detalhes["slot2_val"] = b_tag.get_text(strip=True)
+                    else: detalhes["slot2_val"] = li_s2.get_text().replace("Slot 2:", "").strip()
+            else:
+                 detalhes["slot2_val"] = "N/A"
+
+        except: METRICAS.contar("specs_descartadas_total", campo="slots")
+
+    except Exception as e:
+        # Falha de rede (já depois das retentativas do cliente): marcada para não virar dado salvo
+        METRICAS.contar("ram_falhas_total", motivo="erro_requisicao")
+        detalhes["erro"] = f"{type(e).__name__}: {e}"
+    
+    return detalhes
+
+
+def buscar_detalhes(links, cliente=None, max_workers=None):
+    # Detalhes de cada link, na mesma ordem, com progresso no formato de sempre
+    cliente = cliente or criar_cliente()
+    concluidos = [0]
+
+    def mostrar_progresso(i, info):
+        concluidos[0] += 1
+        print(f"[{concluidos[0]}/{len(links)}] {info['geracao']} | S1: {info['slot1_val']} | S2: {info['slot2_val']}")
+
+    return buscar_em_paralelo(partial(extrair_detalhes_ram, cliente=cliente), links, max_workers or MAX_WORKERS, mostrar_progresso)
+
+
+def enriquecer_ram(df, cliente=None, max_workers=None, reaproveitar=None):
+    # Acrescenta (ou atualiza) as colunas de RAM no DataFrame; linhas sem Link ficam em branco.
+    # reaproveitar: DataFrame (índice = Link, colunas = COLUNAS_RAM) com o que já se sabe de
+    # rodadas anteriores; esses links não são baixados de novo.
+    df = df.copy()
+    com_link = df["Link"].astype(str) != ""
+    conhecidos = com_link & df["Link"].isin(reaproveitar.index if reaproveitar is not None else [])
+    buscar = com_link & ~conhecidos
+    infos = buscar_detalhes(df.loc[buscar, "Link"].tolist(), cliente, max_workers)
+    for coluna, chave in zip(COLUNAS_RAM, CHAVES_RAM):
+        if coluna not in df.columns: df[coluna] = ""
+        df[coluna] = df[coluna].astype(object)
+        df.loc[buscar, coluna] = pd.Series([info[chave] for info in infos], index=df.index[buscar], dtype=object)
+        if conhecidos.any():
+            df.loc[conhecidos, coluna] = reaproveitar.loc[df.loc[conhecidos, "Link"], coluna].values
+    # Páginas que falharam ficam com os valores padrão na tabela, mas não entram no estado
+    # incremental (incremental.salvar), então são buscadas de novo na próxima rodada
+    df.attrs["ram_falhas"] = [link for link, info in zip(df.loc[buscar, "Link"], infos) if "erro" in info]
+    if df.attrs["ram_falhas"]: print(f"⚠️ {len(df.attrs['ram_falhas'])} páginas de produto falharam (ficam para a próxima rodada).")
+    print(f"🔗 {int(com_link.sum())} de {len(df)} linhas tinham link.")
+    if conhecidos.any(): print(f"♻️ {int(conhecidos.sum())} reaproveitados sem baixar a página de novo.")
+    return df
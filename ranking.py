@@ -0,0 +1,208 @@
+# --- RANKING E FILTROS LOCAIS SOBRE A TABELA ENRIQUECIDA ---
+# No lugar de ordenar/filtrar à mão no Sheets: carrega a tabela final (intermediário do pipeline,
+# planilha local ou Sheets) uma vez, monta os índices e responde consultas do tipo
+# "top 20 por Custo-Benefício Total com DDR5, sem RAM soldada, 2 slots e preço < 6000".
+#   - índice por valor (texto/categoria): valor -> posições das linhas
+#   - índice ordenado (números): valores ordenados + posições, faixas por busca binária
+#   - ordem pronta de cada coluna de ranking (os CBs), então o top-K só percorre essa ordem
+# "8 GB", "Máximo de 64GB" etc. viram colunas numéricas (Slot 1 GB, Slot 2 GB, RAM Máxima GB).
+#
+# Uso:
+#   python ranking.py --top 20 --onde "Geração DDR=DDR5" --onde "RAM Soldada=Não possui" \
+#       --onde "Slots Ativos=2" --onde "Preço<6000"
+#   indice = IndiceNotebooks(carregar_tabela()); indice.top(20, filtros=["Preço<6000"])
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from custo_beneficio import PERFIS_PESO, converter_precos
+
+ORDEM_PADRAO = "Custo-Benefício Total"
+TOP_PADRAO = 20
+
+# Colunas com "8 GB", "1 TB", "Vazio"... -> número em GB
+COLUNAS_GB = {"Slot 1": "Slot 1 GB", "Slot 2": "Slot 2 GB", "RAM Máxima": "RAM Máxima GB"}
+COLUNAS_NUMERICAS = ["Preço", "Score CPU", "CB CPU", "Score GPU", "CB GPU", "Slots Ativos"] + list(COLUNAS_GB.values())
+# Índices montados já na carga (os demais na primeira consulta que usar a coluna)
+COLUNAS_CATEGORIA = ["Geração DDR", "RAM Soldada", "Slots Ativos"]
+COLUNAS_EXIBIR = ["Modelo", "Preço", "CPU", "GPU", "Geração DDR", "RAM Soldada", "Slots Ativos", "RAM Máxima", "Link"]
+
+# Operadores de filtro (na mesma posição, os de dois caracteres ganham, senão "<=" vira "<")
+OPERADORES = ["<=", ">=", "!=", "=", "<", ">", "~"]
+PADRAO_GB = re.compile(r"(\d+(?:[.,]\d+)?)\s*(tb|gb)", re.IGNORECASE)
+
+
+def texto_para_gb(valor):
+    # "8 GB" -> 8.0, "máximo de 64gb" -> 64.0, "1 TB" -> 1024.0, "Vazio" -> 0.0, "N/A" -> NaN
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool): return float(valor)
+    texto = str(valor or "").strip()
+    if texto.lower() == "vazio": return 0.0
+    match = PADRAO_GB.search(texto)
+    if not match: return np.nan
+    numero = float(match.group(1).replace(",", "."))
+    return numero * 1024 if match.group(2).lower() == "tb" else numero
+
+
+def preparar_tabela(df, perfis=PERFIS_PESO):
+    # Cópia com as colunas numéricas prontas para comparar (vindas do Sheets, tudo chega como texto)
+    df = df.reset_index(drop=True).copy()
+    for origem, destino in COLUNAS_GB.items():
+        if origem in df.columns: df[destino] = df[origem].map(texto_para_gb)
+    if "Preço" in df.columns:
+        # Preço 0 é "inválido" (ver custo_beneficio): fica de fora de qualquer faixa de preço
+        df["Preço"] = converter_precos(df["Preço"]).replace(0.0, np.nan)
+    for coluna in COLUNAS_NUMERICAS + list(perfis):
+        if coluna in df.columns and coluna != "Preço": df[coluna] = pd.to_numeric(df[coluna], errors="coerce")
+    return df
+
+
+def ler_filtro(texto):
+    # "Preço<6000" -> ("Preço", "<", "6000"); "Geração DDR=DDR5|LPDDR5X" -> ("Geração DDR", "=", "DDR5|LPDDR5X")
+    # Vale o operador que aparece primeiro: "Modelo~Acer (R$ <5000)" é um "~", não um "<"
+    posicoes = [(texto.find(op), -len(op), op) for op in OPERADORES if op in texto]
+    if not posicoes: raise ValueError(f"Filtro sem operador ({', '.join(OPERADORES)}): {texto!r}")
+    posicao, _, op = min(posicoes)
+    return texto[:posicao].strip(), op, texto[posicao + len(op):].strip()
+
+
+class IndiceNotebooks:
+    def __init__(self, df, perfis=PERFIS_PESO):
+        self.df = preparar_tabela(df, perfis)
+        self.n = len(self.df)
+        self.numericas = [c for c in COLUNAS_NUMERICAS + list(perfis) if c in self.df.columns]
+        self.por_valor = {}    # coluna -> {valor: posições}
+        self.ordenados = {}    # coluna -> (valores ordenados sem NaN, posições)
+        self.ordens = {}       # (coluna, decrescente) -> posições na ordem do ranking
+        for coluna in COLUNAS_CATEGORIA:
+            if coluna in self.df.columns: self.indice_valor(coluna)
+        for coluna in perfis:
+            if coluna in self.df.columns: self.ordem(coluna, True)
+
+    # --- ÍNDICES ---
+    def indice_valor(self, coluna):
+        if coluna not in self.por_valor:
+            grupos = {}
+            for posicao, valor in enumerate(self.df[coluna].tolist()):
+                grupos.setdefault(self.chave(coluna, valor), []).append(posicao)
+            self.por_valor[coluna] = {valor: np.array(posicoes) for valor, posicoes in grupos.items()}
+        return self.por_valor[coluna]
+
+    def indice_ordenado(self, coluna):
+        if coluna not in self.ordenados:
+            valores = self.df[coluna].to_numpy(dtype=float)
+            posicoes = np.flatnonzero(~np.isnan(valores))
+            posicoes = posicoes[np.argsort(valores[posicoes], kind="stable")]
+            self.ordenados[coluna] = (valores[posicoes], posicoes)
+        return self.ordenados[coluna]
+
+    def ordem(self, coluna, decrescente=True):
+        # Linhas sem valor vão para o fim; empate mantém a ordem da tabela
+        if (coluna, decrescente) not in self.ordens:
+            valores, posicoes = self.indice_ordenado(coluna)
+            if decrescente: posicoes = posicoes[np.lexsort((posicoes, -valores))]
+            sem_valor = np.setdiff1d(np.arange(self.n), posicoes, assume_unique=True)
+            self.ordens[(coluna, decrescente)] = np.concatenate([posicoes, sem_valor])
+        return self.ordens[(coluna, decrescente)]
+
+    def chave(self, coluna, valor):
+        # Valores de coluna numérica são comparados como número ("2" == 2.0)
+        if coluna in self.numericas:
+            try: return float(valor)
+            except (TypeError, ValueError): return None
+        return str(valor).strip()
+
+    # --- FILTROS ---
+    def mascara(self, coluna, op, valor):
+        if coluna not in self.df.columns:
+            raise KeyError(f"Coluna {coluna!r} não existe (colunas: {', '.join(self.df.columns)})")
+        mascara = np.zeros(self.n, dtype=bool)
+
+        if op == "~":
+            # "contém", sem diferenciar maiúsculas (ex: Consultas~windows); sem índice, varre a coluna
+            mascara[:] = self.df[coluna].astype(str).str.contains(str(valor), case=False, regex=False).to_numpy()
+            return mascara
+
+        if op in ("=", "!="):
+            indice = self.indice_valor(coluna)
+            alternativas = valor if isinstance(valor, (list, tuple, set)) else str(valor).split("|")
+            for alternativa in alternativas:
+                posicoes = indice.get(self.chave(coluna, alternativa))
+                if posicoes is not None: mascara[posicoes] = True
+            return ~mascara if op == "!=" else mascara
+
+        if coluna not in self.numericas: raise ValueError(f"{op} só vale para colunas numéricas: {', '.join(self.numericas)}")
+        valores, posicoes = self.indice_ordenado(coluna)
+        limite = float(valor)
+        if op == "<": selecionadas = posicoes[:np.searchsorted(valores, limite, "left")]
+        elif op == "<=": selecionadas = posicoes[:np.searchsorted(valores, limite, "right")]
+        elif op == ">": selecionadas = posicoes[np.searchsorted(valores, limite, "right"):]
+        else: selecionadas = posicoes[np.searchsorted(valores, limite, "left"):]
+        mascara[selecionadas] = True
+        return mascara
+
+    def filtrar(self, filtros=()):
+        # filtros: ["Preço<6000", ...] ou [("Preço", "<", 6000), ...]; todos precisam valer (E)
+        mascara = np.ones(self.n, dtype=bool)
+        for filtro in filtros:
+            coluna, op, valor = ler_filtro(filtro) if isinstance(filtro, str) else filtro
+            mascara &= self.mascara(coluna, op, valor)
+        return mascara
+
+    def top(self, k=TOP_PADRAO, ordenar_por=ORDEM_PADRAO, filtros=(), decrescente=True, colunas=None):
+        # As k melhores linhas que passam nos filtros, na ordem de ordenar_por
+        if ordenar_por not in self.numericas: raise ValueError(f"Só dá para ordenar por coluna numérica: {', '.join(self.numericas)}")
+        ordem = self.ordem(ordenar_por, decrescente)
+        escolhidas = ordem[self.filtrar(filtros)[ordem]][:k]
+        resultado = self.df.iloc[escolhidas]
+        if colunas: resultado = resultado[[c for c in colunas if c in resultado.columns]]
+        return resultado
+
+
+# --- ORIGEM DOS DADOS ---
+def carregar_tabela(origem=None):
+    # origem: DataFrame, caminho de .pkl, "local" (planilha_local.sqlite) ou "sheets".
+    # Padrão: o intermediário final do pipeline (intermediarios/ram.pkl), senão a planilha local.
+    from pipeline import caminho_intermediario, ler_tabela
+
+    if isinstance(origem, pd.DataFrame): return origem
+    if origem is None: origem = caminho_intermediario("ram") if os.path.exists(caminho_intermediario("ram")) else "local"
+    if origem in ("local", "sheets"):
+        from armazenamento import abrir_planilha
+        return ler_tabela(abrir_planilha(origem))
+    return pd.read_pickle(origem)
+
+
+def principal(argv=None):
+    parser = argparse.ArgumentParser(description="Top-K e filtros sobre a tabela de notebooks")
+    parser.add_argument("--top", type=int, default=TOP_PADRAO)
+    parser.add_argument("--por", default=ORDEM_PADRAO, help="coluna numérica do ranking")
+    parser.add_argument("--crescente", action="store_true", help="menor primeiro (ex: --por Preço)")
+    parser.add_argument("--onde", action="append", default=[], metavar="FILTRO",
+                        help='ex: "Preço<6000", "Geração DDR=DDR5|LPDDR5X", "Consultas~windows" (pode repetir)')
+    parser.add_argument("--origem", help='.pkl, "local" ou "sheets" (padrão: intermediarios/ram.pkl ou a planilha local)')
+    parser.add_argument("--colunas", help="colunas exibidas, separadas por vírgula")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    indice = IndiceNotebooks(carregar_tabela(args.origem))
+    carga = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultado = indice.top(args.top, args.por, args.onde, decrescente=not args.crescente)
+    consulta = time.perf_counter() - inicio
+
+    colunas = args.colunas.split(",") if args.colunas else COLUNAS_EXIBIR[:2] + [args.por] + COLUNAS_EXIBIR[2:]
+    colunas = [c for c in dict.fromkeys(colunas) if c in resultado.columns]
+    with pd.option_context("display.max_colwidth", 60, "display.width", 250):
+        print(resultado[colunas].to_string() if len(resultado) else "Nenhum notebook passa nos filtros.")
+    print(f"\n⚡ {len(resultado)} de {indice.n} notebooks | consulta em {consulta * 1000:.2f} ms (carga + índices em {carga * 1000:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
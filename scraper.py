@@ -0,0 +1,382 @@
+# --- SCRAPER DA LISTAGEM (SELENIUM) ---
+# Funções do 2-scraper.py, importáveis pelo pipeline: Chrome headless, espera por prontidão,
+# extração dos cards numa chamada só e pool de navegadores para as páginas.
+import queue
+import re
+import threading
+import time
+from urllib.parse import urlencode
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from metricas import METRICAS
+
+URL_OFERTAS = "https://quenotebookcomprar.com.br/ofertas/"
+URL_BASE = "https://quenotebookcomprar.com.br/ofertas/?sort_order=_sfm_sale_lowest-price+asc+num&recomm=games-complex&_sfm_spec_laptop_category=Gamer&_sfm_spec_laptop_operating_system=Linux-%2B-Sem+sistema+operacional-%2B-Shell+EFI&post_types=notebooks"
+COLUNAS_SCRAPER = ["Modelo", "Preço", "Cupom", "CPU", "GPU", "RAM", "Link"]
+
+
+# --- CONSULTAS (VÁRIAS BUSCAS NA MESMA RODADA) ---
+# {nome: url}. Um notebook que aparece em mais de uma busca entra uma vez só (pelo Link) e a
+# coluna "Consultas" diz em quais delas ele apareceu.
+COLUNA_CONSULTAS = "Consultas"
+COLUNAS_LISTAGEM = COLUNAS_SCRAPER + [COLUNA_CONSULTAS]
+SEPARADOR_CONSULTAS = ", "
+
+
+def url_consulta(categoria="Gamer", sistemas=("Linux", "Sem sistema operacional", "Shell EFI"),
+                 recomendacao="games-complex", ordem="_sfm_sale_lowest-price asc num"):
+    # Monta a URL de uma busca da listagem (sem argumentos devolve a URL_BASE).
+    # categoria/sistemas aceitam um valor ou uma lista (o site junta as opções com "-+-")
+    juntar = lambda valor: valor if isinstance(valor, str) else "-+-".join(valor)
+    parametros = {"sort_order": ordem}
+    if recomendacao: parametros["recomm"] = recomendacao
+    if categoria: parametros["_sfm_spec_laptop_category"] = juntar(categoria)
+    if sistemas: parametros["_sfm_spec_laptop_operating_system"] = juntar(sistemas)
+    parametros["post_types"] = "notebooks"
+    return f"{URL_OFERTAS}?{urlencode(parametros)}"
+
+
+CONSULTAS = {"gamer-linux": URL_BASE}
+
+
+# --- CONFIGURAÇÃO DO CHROME ---
+# Quantos Chromes headless raspam as páginas ao mesmo tempo (1 = sequencial, como antes)
+NUM_WORKERS = 3
+# Teto de educação com o site: nunca abre mais navegadores que isso, mesmo se NUM_WORKERS for maior
+LIMITE_WORKERS = 4
+
+
+def criar_driver(porta_debug=9222):
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    # Cada instância precisa da sua própria porta, senão os Chromes paralelos brigam pela 9222
+    options.add_argument(f'--remote-debugging-port={porta_debug}')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    return webdriver.Chrome(options=options)
+
+
+# --- FUNÇÕES DE EXTRAÇÃO (Reutilizáveis para cada página) ---
+# "script": lê todos os cards numa única chamada execute_script (1 ida ao chromedriver por página)
+# "elementos": modo antigo, um find_element/get_attribute por campo de cada card
+MODO_EXTRACAO = "script"
+
+# Roda dentro do navegador e devolve os campos BRUTOS de cada card.
+# A limpeza (preço, cupom, specs) continua toda no Python, igual para os dois modos.
+SCRIPT_EXTRACAO_CARDS = """
+const texto = (el) => (el ? el.innerText : null);
+return Array.from(document.querySelectorAll("div.list_item")).map((card) => {
+    const titulo = card.querySelector("div.infos h4 a");
+    let preco = card.querySelector(".buy-box .lowest-price a");
+    if (!preco) preco = card.querySelector(".buy-box .lowest-price-without-discounts p b");
+    return {
+        modelo: texto(titulo),
+        link: titulo ? titulo.href : null,
+        preco: texto(preco),
+        cupons: Array.from(card.querySelectorAll(".coupon-code")).map((c) => c.textContent),
+        cpu: texto(card.querySelector(".spec_stamp.cpu span")),
+        gpu: texto(card.querySelector(".spec_stamp.gpu span")),
+        specs: Array.from(card.querySelectorAll(".spec_stamps.mobile span.spec_mobile")).map((s) => s.innerText),
+    };
+});
+"""
+
+
+def normalizar_preco_brl(preco_texto):
+    # TRATAMENTO DO PREÇO (O Segredo)
+    # 1. Tira o R$ e espaços
+    p_limpo = (preco_texto or "0").replace("R$", "").strip()
+    # 2. Tira o PONTO de milhar (3.529 vira 3529)
+    p_limpo = p_limpo.replace(".", "")
+    # 3. Troca a VÍRGULA decimal por PONTO (3529,99 vira 3529.99)
+    p_limpo = p_limpo.replace(",", ".")
+    
+    # Converte para float apenas se tiver números
+    if any(char.isdigit() for char in p_limpo):
+        return float(p_limpo)
+    return 0.0
+
+
+def montar_registro(bruto):
+    # Transforma os campos brutos de um card na linha final [Modelo, Preço, Cupom, CPU, GPU, RAM, Link].
+    # Levanta exceção se o card não tiver modelo/link (o chamador descarta o card).
+    if bruto.get("modelo") is None or bruto.get("link") is None:
+        raise ValueError("Card sem modelo/link")
+
+    preco_float = normalizar_preco_brl(bruto.get("preco"))
+
+    # CUPOM: textContent pega o texto mesmo se estiver oculto/overlay
+    cupom = ""
+    for texto_cupom in bruto.get("cupons") or []:
+        texto_cupom = (texto_cupom or "").strip()
+        if texto_cupom:
+            cupom = texto_cupom
+            break # Achou um cupom válido, para de procurar
+
+    cpu = bruto.get("cpu")
+    cpu = cpu.replace("\n", " ") if cpu is not None else "N/A"
+
+    gpu = bruto.get("gpu")
+    gpu = gpu.replace("\n", " ").replace("Dedicada", "").replace("GeForce", "").strip() if gpu is not None else "N/A"
+
+    ram = "N/A"
+    for txt in bruto.get("specs") or []:
+        if ("RAM" in txt or "GB" in txt) and "SSD" not in txt:
+            ram = txt; break
+
+    return [bruto["modelo"], preco_float, cupom, cpu, gpu, ram, bruto["link"]]
+
+
+def ler_card_por_elementos(card):
+    # Modo antigo: cada campo é uma ida ao chromedriver
+    # A. MODELO
+    titulo = card.find_element(By.CSS_SELECTOR, "div.infos h4 a")
+    bruto = {"modelo": titulo.get_attribute('innerText'), "link": titulo.get_attribute("href")}
+
+    # B. PREÇO
+    bruto["preco"] = "0"
+    try:
+        # Tenta pegar preço verde
+        bruto["preco"] = card.find_element(By.CSS_SELECTOR, ".buy-box .lowest-price a").text
+    except:
+        try:
+            # Tenta pegar preço normal
+            bruto["preco"] = card.find_element(By.CSS_SELECTOR, ".buy-box .lowest-price-without-discounts p b").text
+        except: pass
+
+    # C. CUPOM (Busca TODOS os elementos de cupom dentro do card)
+    try: bruto["cupons"] = [c.get_attribute("textContent") for c in card.find_elements(By.CSS_SELECTOR, ".coupon-code")]
+    except: bruto["cupons"] = []
+
+    # D. SPECS
+    try: bruto["cpu"] = card.find_element(By.CSS_SELECTOR, ".spec_stamp.cpu span").get_attribute('innerText')
+    except: bruto["cpu"] = None
+
+    try: bruto["gpu"] = card.find_element(By.CSS_SELECTOR, ".spec_stamp.gpu span").get_attribute('innerText')
+    except: bruto["gpu"] = None
+
+    try: bruto["specs"] = [s.get_attribute('innerText') for s in card.find_elements(By.CSS_SELECTOR, ".spec_stamps.mobile span.spec_mobile")]
+    except: bruto["specs"] = []
+
+    return bruto
+
+
+# --- ESPERA POR PRONTIDÃO (no lugar dos sleeps fixos de 4s + 3s) ---
+# Tempo máximo que uma página pode levar para ficar pronta
+TIMEOUT_ESPERA = 15
+# Intervalo entre as checagens e quantas checagens seguidas sem card novo contam como "estável"
+INTERVALO_ESPERA = 0.5
+CHECAGENS_ESTAVEIS = 2
+# Guarda o tempo de espera de cada página para o resumo no final (para ajustar o timeout)
+TEMPOS_ESPERA = []
+
+# Devolve [qtd de cards, qtd de preços, altura da página]
+SCRIPT_CONTAGEM = """
+return [
+    document.querySelectorAll("div.list_item").length,
+    document.querySelectorAll(".buy-box .lowest-price a, .buy-box .lowest-price-without-discounts p b").length,
+    document.body.scrollHeight,
+];
+"""
+
+
+def esperar_cards(driver, timeout=TIMEOUT_ESPERA):
+    # Fase 1: espera existir pelo menos um div.list_item e os preços da .buy-box
+    def cards_e_precos_presentes(d):
+        qtd_cards, qtd_precos, _ = d.execute_script(SCRIPT_CONTAGEM)
+        return qtd_cards > 0 and qtd_precos > 0
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=INTERVALO_ESPERA).until(cards_e_precos_presentes)
+        return True
+    except TimeoutException:
+        return False
+
+
+def esperar_lazy_load(driver, timeout=TIMEOUT_ESPERA):
+    # Fase 2: rola até o fim repetidamente até a contagem de cards (e a altura) parar de crescer
+    limite = time.time() + timeout
+    anterior = None
+    estaveis = 0
+    while time.time() < limite:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(INTERVALO_ESPERA)
+        atual = driver.execute_script(SCRIPT_CONTAGEM)
+        if atual == anterior:
+            estaveis += 1
+            if estaveis >= CHECAGENS_ESTAVEIS: return True
+        else:
+            estaveis = 0
+        anterior = atual
+    return False
+
+
+def esperar_pagina_pronta(driver, rotulo="Página"):
+    inicio = time.time()
+    limite = TIMEOUT_ESPERA
+
+    ok = esperar_cards(driver, limite)
+    # O lazy load usa só o que sobrou do timeout
+    if ok:
+        ok = esperar_lazy_load(driver, max(0, limite - (time.time() - inicio)))
+
+    espera = time.time() - inicio
+    TEMPOS_ESPERA.append(espera)
+    if ok: print(f"⏱️ {rotulo} pronta em {espera:.1f}s")
+    else: print(f"⏱️ {rotulo}: timeout de {TIMEOUT_ESPERA}s atingido ({espera:.1f}s), extraindo o que carregou.")
+    return espera
+
+
+def extrair_dados_da_pagina(driver, modo=None):
+    # Espera-se que a página já esteja pronta (esperar_pagina_pronta)
+    modo = modo or MODO_EXTRACAO
+
+    if modo == "script":
+        brutos = driver.execute_script(SCRIPT_EXTRACAO_CARDS) or []
+    else:
+        brutos = []
+        for card in driver.find_elements(By.CSS_SELECTOR, "div.list_item"):
+            try: brutos.append(ler_card_por_elementos(card))
+            except:
+                METRICAS.contar("cards_descartados_total", motivo="erro_leitura")
+                continue
+
+    return montar_registros(brutos)
+
+
+def montar_registros(brutos):
+    # Cards brutos -> linhas, contando os descartes (usado também pela listagem HTTP de scraper_http)
+    dados_locais = []
+    for bruto in brutos:
+        try:
+            dados_locais.append(montar_registro(bruto))
+        except Exception as e:
+            # print(f"Erro num card: {e}") # Descomente para debugar
+            METRICAS.contar("cards_descartados_total", motivo="sem_modelo_link" if isinstance(e, ValueError) else "erro_montagem")
+            continue
+
+    METRICAS.contar("cards_lidos_total", len(dados_locais))
+    return dados_locais
+
+
+# --- PAGINAÇÃO ---
+def raspar_paginas_em_paralelo(urls_paginas, num_workers, driver_inicial, ao_extrair_pagina=None):
+    # Fila compartilhada: cada worker pega a próxima página livre até acabar.
+    # O worker 0 reaproveita o driver que já está aberto; os outros sobem o seu próprio Chrome.
+    # ao_extrair_pagina(i, linhas): chamado assim que cada página é lida (se bloquear, o worker espera).
+    # Itens: (i, url) ou (i, url, rótulo) quando i não é um número legível (ex: "[gamer] Página 3").
+    fila = queue.Queue()
+    for item in urls_paginas:
+        fila.put(item)
+
+    resultados = {}
+    trava = threading.Lock()
+
+    def worker(n):
+        try:
+            driver_worker = driver_inicial if n == 0 else criar_driver(9222 + n)
+        except Exception as e:
+            print(f"❌ Worker {n} não conseguiu abrir o Chrome: {e}")
+            return
+        try:
+            while True:
+                try: i, url, *rotulo = fila.get_nowait()
+                except queue.Empty: break
+                rotulo = rotulo[0] if rotulo else f"Página {i}"
+
+                print(f"\n🔄 [W{n}] Indo para {rotulo}...")
+                try:
+                    with METRICAS.cronometro("chrome_pagina_segundos"):
+                        driver_worker.get(url)
+                        esperar_pagina_pronta(driver_worker, f"[W{n}] {rotulo}")
+                    dados_pagina = extrair_dados_da_pagina(driver_worker)
+                except Exception as e:
+                    print(f"⚠️ [W{n}] Erro em {rotulo}: {e}")
+                    METRICAS.contar("paginas_com_erro_total", erro=type(e).__name__)
+                    dados_pagina = []
+
+                with trava:
+                    resultados[i] = dados_pagina
+                print(f"📦 [W{n}] {rotulo}: {len(dados_pagina)} itens extraídos.")
+                if ao_extrair_pagina: ao_extrair_pagina(i, dados_pagina)
+        finally:
+            driver_worker.quit()
+
+    # num_workers >= 1: o worker 0 sempre roda, então o driver inicial sempre é fechado
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(num_workers)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return resultados
+
+
+def juntar_paginas(paginas):
+    # Junta na ordem das páginas e remove repetidos pelo Link (7º campo da linha).
+    # Linhas com o 8º campo (Consultas): o repetido vindo de outra consulta não se perde, o nome
+    # dela é acrescentado na linha que ficou.
+    todos = []
+    por_link = {}
+    for i in sorted(paginas):
+        for linha in paginas[i]:
+            anterior = por_link.get(linha[6])
+            if anterior is None:
+                linha = list(linha)
+                por_link[linha[6]] = linha
+                todos.append(linha)
+            elif len(linha) > 7 and linha[7] not in anterior[7].split(SEPARADOR_CONSULTAS):
+                anterior[7] += SEPARADOR_CONSULTAS + linha[7]
+                METRICAS.contar("cards_em_outra_consulta_total")
+            else:
+                METRICAS.contar("cards_descartados_total", motivo="link_repetido")
+    return todos
+
+
+def raspar_listagem(base_url=URL_BASE, num_workers=None, ao_extrair_pagina=None):
+    # Abre a página 1, descobre quantas páginas existem e divide o resto entre os navegadores.
+    # Devolve as linhas [Modelo, Preço, Cupom, CPU, GPU, RAM, Link] sem Links repetidos.
+    # ao_extrair_pagina(i, linhas): recebe cada página assim que ela é extraída (modo streaming).
+    TEMPOS_ESPERA.clear()
+    num_workers = num_workers or NUM_WORKERS
+    driver = criar_driver()
+
+    print(f"Acessando Página 1: {base_url}")
+    inicio_pagina_1 = time.perf_counter()
+    driver.get(base_url)
+    # Só a fase 1 aqui: basta a listagem existir para ler a paginação
+    if not esperar_cards(driver, TIMEOUT_ESPERA):
+        print(f"⚠️ Cards não apareceram em {TIMEOUT_ESPERA}s na Página 1.")
+
+    total_paginas = 1
+    try:
+        texto_paginacao = driver.find_element(By.CSS_SELECTOR, "span.pages").text
+        print(f"📄 {texto_paginacao}")
+        match = re.search(r"de (\d+)", texto_paginacao)
+        if match:
+            total_paginas = int(match.group(1))
+            print(f"🔢 Total de páginas detectadas: {total_paginas}")
+    except:
+        print("⚠️ Paginação não encontrada, assumindo página única.")
+
+    # Página 1 já está aberta; as demais são divididas entre os workers
+    urls_paginas = [(i, f"{base_url}&sf_paged={i}") for i in range(2, total_paginas + 1)]
+    num_workers = max(1, min(num_workers, LIMITE_WORKERS, len(urls_paginas)))
+    print(f"👷 {num_workers} navegador(es) para {len(urls_paginas)} página(s) restantes.")
+
+    esperar_pagina_pronta(driver, "Página 1")
+    METRICAS.observar("chrome_pagina_segundos", time.perf_counter() - inicio_pagina_1)
+    paginas = {1: extrair_dados_da_pagina(driver)}
+    print(f"📦 Página 1: {len(paginas[1])} itens extraídos.")
+    if ao_extrair_pagina: ao_extrair_pagina(1, paginas[1])
+    paginas.update(raspar_paginas_em_paralelo(urls_paginas, num_workers, driver, ao_extrair_pagina))
+
+    todos_dados = juntar_paginas(paginas)
+    if TEMPOS_ESPERA:
+        print(f"⏱️ Espera por página: média {sum(TEMPOS_ESPERA) / len(TEMPOS_ESPERA):.1f}s | máx {max(TEMPOS_ESPERA):.1f}s (timeout {TIMEOUT_ESPERA}s)")
+    print(f"🧮 {sum(len(p) for p in paginas.values())} itens lidos, {len(todos_dados)} únicos por Link.")
+    return todos_dados
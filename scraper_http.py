@@ -0,0 +1,204 @@
+# --- SCRAPER DA LISTAGEM SEM NAVEGADOR (HTTP + PARSE DO HTML) ---
+# Os cards (div.list_item com título, .buy-box, .coupon-code e .spec_stamp) já vêm no HTML que o
+# servidor manda, então a listagem pode ser lida com requisições comuns (ClienteHTTP: pool
+# keep-alive, limite por host, retentativas) e o lxml, sem subir Chrome nenhum.
+# Página que chega sem o conteúdo que o navegador carregaria depois (sem cards, maioria dos cards sem preço,
+# página do meio com menos cards que a primeira) é refeita pelo caminho Selenium de scraper.py.
+# As linhas saem iguais às de extrair_dados_da_pagina: [Modelo, Preço, Cupom, CPU, GPU, RAM, Link],
+# mais o nome da consulta (CONSULTAS em scraper.py) de onde cada uma veio.
+import re
+import time
+from urllib.parse import urljoin
+
+from cliente_http import ClienteHTTP, buscar_em_paralelo
+from leitor_html import ler_trecho
+from metricas import METRICAS
+import scraper
+from scraper import (CONSULTAS, montar_registros, juntar_paginas, criar_driver, raspar_listagem,
+                     raspar_paginas_em_paralelo)
+
+# "http": listagem por requisições, Selenium só nas páginas incompletas; "selenium": sempre Chrome
+MODO_LISTAGEM = "http"
+# Páginas baixadas ao mesmo tempo (o ClienteHTTP ainda limita as requisições por segundo)
+MAX_WORKERS_HTTP = 8
+REQ_POR_SEGUNDO = 4
+# Acima dessa fração de cards sem preço a página é tida como não carregada (alguns sem preço = fora de estoque)
+FRACAO_SEM_PRECO = 0.5
+
+
+def texto_visivel(el):
+    # Aproxima o innerText do navegador: <br> vira quebra de linha e os espaços do código-fonte somem
+    if el is None: return None
+    for br in el.find_all("br"):
+        br.replace_with("\n")
+    linhas = (" ".join(linha.split()) for linha in el.get_text().split("\n"))
+    return "\n".join(linha for linha in linhas if linha)
+
+
+def cards_brutos_html(html, base_url):
+    # Mesmos campos e seletores do SCRIPT_EXTRACAO_CARDS, lidos do HTML sem navegador
+    brutos = []
+    for card in ler_trecho(html, "div", "list_item").select("div.list_item"):
+        titulo = card.select_one("div.infos h4 a")
+        preco = card.select_one(".buy-box .lowest-price a") or card.select_one(".buy-box .lowest-price-without-discounts p b")
+        brutos.append({
+            "modelo": texto_visivel(titulo),
+            "link": urljoin(base_url, titulo["href"]) if titulo is not None and titulo.get("href") else None,
+            "preco": texto_visivel(preco),
+            "cupons": [c.get_text() for c in card.select(".coupon-code")],
+            "cpu": texto_visivel(card.select_one(".spec_stamp.cpu span")),
+            "gpu": texto_visivel(card.select_one(".spec_stamp.gpu span")),
+            "specs": [texto_visivel(s) for s in card.select(".spec_stamps.mobile span.spec_mobile")],
+        })
+    return brutos
+
+
+def total_de_paginas(html):
+    paginacao = ler_trecho(html, "span", "pages").select_one("span.pages")
+    if paginacao is None: return None
+    match = re.search(r"de (\d+)", paginacao.get_text(" ", strip=True))
+    return int(match.group(1)) if match else None
+
+
+def sem_preco(brutos):
+    return sum(1 for b in brutos if not (b["preco"] or "").strip())
+
+
+def motivo_incompleta(brutos, esperado=None):
+    # Por que a página precisa do navegador (None = HTML já tem tudo)
+    if not brutos: return "sem_cards"
+    if sem_preco(brutos) > FRACAO_SEM_PRECO * len(brutos): return "cards_sem_preco"
+    if esperado and len(brutos) < esperado: return "pagina_curta"
+    return None
+
+
+def com_consulta(linhas, nome):
+    return [list(linha) + [nome] for linha in linhas]
+
+
+def raspar_consultas_http(consultas, num_workers=None, ao_extrair_pagina=None, cliente=None, fallback_selenium=True):
+    # consultas: {nome: url}. As páginas de todas as consultas dividem o mesmo pool de downloads
+    # (e, no fallback, os mesmos Chromes). Devolve {(k, i): linhas com o nome da consulta no fim},
+    # k = posição da consulta; ao_extrair_pagina((k, i), linhas) a cada página pronta.
+    # num_workers vale para os Chromes do fallback.
+    cliente = cliente or ClienteHTTP(req_por_segundo=REQ_POR_SEGUNDO, max_conexoes=MAX_WORKERS_HTTP)
+    nomes, urls = list(consultas), list(consultas.values())
+    inicio = time.perf_counter()
+    paginas = {}
+
+    def entregar(chave, linhas):
+        linhas = com_consulta(linhas, nomes[chave[0]])
+        paginas[chave] = linhas
+        if ao_extrair_pagina: ao_extrair_pagina(chave, linhas)
+
+    def url_pagina(k, i):
+        return urls[k] if i == 1 else f"{urls[k]}&sf_paged={i}"
+
+    def baixar(item):
+        k, i = item
+        try:
+            r = cliente.get(url_pagina(k, i), timeout=20)
+            r.raise_for_status()
+            return r
+        except Exception as e:
+            print(f"⚠️ [{nomes[k]}] Página {i} falhou por HTTP: {e}")
+            return None
+
+    def ler_pagina(chave, resposta):
+        # Chamado (na thread principal) assim que cada download termina: página completa já segue
+        # para ao_extrair_pagina, enquanto as outras ainda estão baixando
+        k, i = chave
+        brutos[chave] = cards_brutos_html(resposta.text, resposta.url) if resposta is not None else []
+        if i == 1:
+            total = total_de_paginas(resposta.text)
+            if total: print(f"🔢 [{nomes[k]}] Total de páginas detectadas: {total}")
+            else: print(f"⚠️ [{nomes[k]}] Paginação não encontrada, assumindo página única.")
+            total_paginas[k] = total or 1
+            # Só a última página de cada consulta pode vir menor que a primeira
+            esperado[k] = len(brutos[chave]) if total_paginas[k] > 1 else None
+        motivo = motivo_incompleta(brutos[chave], esperado[k] if i < total_paginas[k] else None)
+        if motivo and fallback_selenium:
+            print(f"🧭 [{nomes[k]}] Página {i}: HTML incompleto ({motivo}, {len(brutos[chave])} cards), vai para o Chrome.")
+            # Rótulo legível para os prints dos workers (a chave (k, i) sairia como tupla)
+            incompletas.append((chave, url_pagina(k, i), f"[{nomes[k]}] Página {i}"))
+            METRICAS.contar("paginas_listagem_total", modo="selenium", motivo=motivo)
+            return
+        METRICAS.contar("paginas_listagem_total", modo="http", motivo="ok")
+        # Poucos cards sem preço (fora de estoque) ficam como vieram, sem abrir o Chrome
+        if sem_preco(brutos[chave]): METRICAS.contar("cards_sem_preco_total", sem_preco(brutos[chave]), consulta=nomes[k])
+        entregar(chave, montar_registros(brutos[chave]))
+        print(f"📦 [{nomes[k]}] Página {i}: {len(paginas[chave])} itens extraídos.")
+
+    total_paginas, esperado, brutos = {}, {}, {}
+    incompletas, sem_primeira = [], []
+
+    # 1. Primeira página de cada consulta (dá o total de páginas e o tamanho de página)
+    for k, url in enumerate(urls): print(f"Acessando [{nomes[k]}] Página 1 (HTTP): {url}")
+    primeiras = [(k, 1) for k in range(len(urls))]
+
+    def ao_baixar_primeira(n, resposta):
+        if resposta is not None: return ler_pagina(primeiras[n], resposta)
+        k = primeiras[n][0]
+        if not fallback_selenium: raise RuntimeError(f"Listagem [{nomes[k]}] não veio por HTTP.")
+        sem_primeira.append(k)
+
+    buscar_em_paralelo(baixar, primeiras, MAX_WORKERS_HTTP, ao_baixar_primeira)
+
+    # 2. Demais páginas de todas as consultas no mesmo pool (as consultas viram "shards" dele)
+    restantes = [(k, i) for k in total_paginas for i in range(2, total_paginas[k] + 1)]
+    buscar_em_paralelo(baixar, restantes, MAX_WORKERS_HTTP, lambda n, resposta: ler_pagina(restantes[n], resposta))
+    print(f"⚡ {len(brutos) - len(incompletas)} página(s) lidas sem navegador em {time.perf_counter() - inicio:.1f}s.")
+
+    # 3. Sem a página 1 não dá para saber a paginação: a consulta inteira vai pelo Chrome
+    for k in sem_primeira:
+        print(f"⚠️ [{nomes[k]}] usando o Chrome para a consulta inteira.")
+        METRICAS.contar("paginas_listagem_total", modo="selenium", motivo="erro_http")
+        raspar_listagem(urls[k], num_workers, lambda i, linhas, k=k: entregar((k, i), linhas))
+
+    # 4. Páginas incompletas de todas as consultas dividem os mesmos Chromes
+    if incompletas:
+        try:
+            driver = criar_driver()
+        except Exception as e:
+            # Sem Chrome: fica o que o HTML trouxe, melhor que perder a página inteira
+            print(f"❌ Chrome indisponível para {len(incompletas)} página(s) ({e}); usando o HTML parcial.")
+            for chave, *_ in incompletas:
+                entregar(chave, montar_registros(brutos[chave]))
+        else:
+            # Lidos na hora (não no import): a célula 2 ajusta scraper.NUM_WORKERS depois de importar
+            num_workers = max(1, min(num_workers or scraper.NUM_WORKERS, scraper.LIMITE_WORKERS, len(incompletas)))
+            raspar_paginas_em_paralelo(incompletas, num_workers, driver, entregar)
+    return paginas
+
+
+def raspar_consultas_selenium(consultas, num_workers=None, ao_extrair_pagina=None):
+    # Uma consulta depois da outra, cada uma com o pool de Chromes de raspar_listagem
+    paginas = {}
+    for k, (nome, url) in enumerate(consultas.items()):
+        print(f"\n🔎 Consulta [{nome}]")
+
+        def entregar(i, linhas, k=k, nome=nome):
+            paginas[(k, i)] = com_consulta(linhas, nome)
+            if ao_extrair_pagina: ao_extrair_pagina((k, i), paginas[(k, i)])
+
+        raspar_listagem(url, num_workers, entregar)
+    return paginas
+
+
+def raspar(consultas=None, num_workers=None, ao_extrair_pagina=None, modo=None, **kwargs):
+    # Ponto de entrada usado pelo pipeline, pelo streaming e pela célula 2.
+    # consultas: {nome: url} (padrão CONSULTAS) ou uma URL só. Devolve as linhas de COLUNAS_LISTAGEM
+    # ([Modelo, Preço, Cupom, CPU, GPU, RAM, Link, Consultas]) sem Links repetidos entre as consultas,
+    # então cada página de produto é enriquecida uma vez só nas etapas seguintes.
+    consultas = consultas or CONSULTAS
+    if isinstance(consultas, str): consultas = {"principal": consultas}
+    if (modo or MODO_LISTAGEM) == "selenium": paginas = raspar_consultas_selenium(consultas, num_workers, ao_extrair_pagina)
+    else: paginas = raspar_consultas_http(consultas, num_workers, ao_extrair_pagina, **kwargs)
+
+    todos_dados = juntar_paginas(paginas)
+    lidos = sum(len(p) for p in paginas.values())
+    print(f"🧮 {lidos} itens lidos em {len(consultas)} consulta(s), {len(todos_dados)} únicos por Link.")
+    nomes = list(consultas)
+    for (k, _), linhas in paginas.items():
+        METRICAS.contar("cards_por_consulta_total", len(linhas), consulta=nomes[k])
+    return todos_dados
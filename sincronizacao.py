@@ -0,0 +1,160 @@
+# --- SINCRONIZAÇÃO COM A PLANILHA (SÓ O QUE MUDOU) ---
+# No lugar de worksheet.clear() + reescrever tudo: compara a tabela nova com o que já está na aba,
+# linha a linha pelo Link, e manda só as células alteradas, as linhas novas e as removidas.
+# - Linhas que continuam existindo ficam no mesmo lugar (a ordem da aba não é refeita).
+# - Colunas da aba que não estão na tabela nova não são tocadas (ex: colunas de RAM quando o
+#   4-benchmark.py roda depois do 5-verifica-ram.py).
+# - A planilha nunca fica vazia no meio da gravação.
+from gspread.utils import rowcol_to_a1
+
+from metricas import METRICAS
+
+FORMATO_PRECO = {"Preço": {"numberFormat": {"type": "CURRENCY", "pattern": "R$ #,##0.00"}}}
+
+
+def valores_iguais(a, b):
+    # A aba devolve números como int/float (UNFORMATTED_VALUE) e textos como str
+    numero = lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    if numero(a) and numero(b): return float(a) == float(b)
+    return str(a) == str(b)
+
+
+def letra_coluna(col):
+    return rowcol_to_a1(1, col)[:-1]
+
+
+def agrupar_consecutivos(numeros):
+    # [2, 3, 4, 8, 9] -> [(2, 4), (8, 9)]
+    grupos = []
+    for n in sorted(numeros):
+        if grupos and n == grupos[-1][1] + 1: grupos[-1][1] = n
+        else: grupos.append([n, n])
+    return [tuple(g) for g in grupos]
+
+
+def calcular_diferencas(atuais, nova_tabela, chave="Link", apagar_ausentes=True):
+    # Compara as duas tabelas (listas de linhas com cabeçalho) e devolve um dict com:
+    # "cabecalho": cabeçalho final da aba; "celulas": {(linha, coluna): valor} (1-based, como a API);
+    # "novas": linhas a acrescentar no fim; "apagar": linhas (1-based) a remover;
+    # "colunas_novas": nomes de colunas criadas agora.
+    # apagar_ausentes=False: só atualiza/acrescenta (para quem manda apenas algumas colunas de algumas linhas)
+    novos_headers = list(nova_tabela[0])
+    headers = list(atuais[0]) if atuais else []
+    linhas_atuais = atuais[1:] if atuais else []
+
+    cabecalho = headers.copy()
+    colunas_novas = [h for h in novos_headers if h not in cabecalho]
+    cabecalho += colunas_novas
+    pos = {h: cabecalho.index(h) for h in novos_headers}
+
+    celulas = {}
+    for h in colunas_novas:
+        celulas[(1, pos[h] + 1)] = h
+
+    # Onde cada Link está hoje na aba (só a primeira ocorrência vale, repetidos são apagados)
+    idx_chave_atual = headers.index(chave) if chave in headers else None
+    linha_por_chave = {}
+    apagar = []
+    for n, row in enumerate(linhas_atuais, start=2):
+        valor = row[idx_chave_atual] if idx_chave_atual is not None and len(row) > idx_chave_atual else ""
+        if valor and valor not in linha_por_chave: linha_por_chave[valor] = n
+        elif apagar_ausentes: apagar.append(n)
+
+    idx_chave_nova = novos_headers.index(chave)
+    vistas = set()
+    novas = []
+    for row in nova_tabela[1:]:
+        valor_chave = row[idx_chave_nova]
+        # Link repetido na tabela nova: vale a primeira ocorrência. Linha sem Link sempre entra como nova.
+        if valor_chave and valor_chave in vistas: continue
+        vistas.add(valor_chave)
+        n = linha_por_chave.get(valor_chave) if valor_chave else None
+
+        if n is None:
+            # Linha nova: monta no layout da aba (colunas que a tabela nova não tem ficam vazias)
+            nova = [""] * len(cabecalho)
+            for h, valor in zip(novos_headers, row): nova[pos[h]] = valor
+            novas.append(nova)
+            continue
+
+        atual = linhas_atuais[n - 2]
+        for h, valor in zip(novos_headers, row):
+            c = pos[h]
+            antigo = atual[c] if c < len(atual) else ""
+            if not valores_iguais(antigo, valor): celulas[(n, c + 1)] = valor
+
+    if apagar_ausentes:
+        apagar += [n for chave_atual, n in linha_por_chave.items() if chave_atual not in vistas]
+    return {"cabecalho": cabecalho, "celulas": celulas, "novas": novas, "apagar": sorted(apagar), "colunas_novas": colunas_novas}
+
+
+def montar_blocos(celulas):
+    # Junta células vizinhas da mesma linha num range só ("H5:L5"), para o batch_update ficar enxuto
+    blocos = []
+    por_linha = {}
+    for (linha, coluna), valor in celulas.items():
+        por_linha.setdefault(linha, {})[coluna] = valor
+    for linha in sorted(por_linha):
+        colunas = por_linha[linha]
+        for inicio, fim in agrupar_consecutivos(colunas):
+            valores = [colunas[c] for c in range(inicio, fim + 1)]
+            faixa = rowcol_to_a1(linha, inicio) if inicio == fim else f"{rowcol_to_a1(linha, inicio)}:{rowcol_to_a1(linha, fim)}"
+            blocos.append({"range": faixa, "values": [valores]})
+    return blocos
+
+
+def aplicar_formatos(worksheet, cabecalho, formatos, colunas):
+    # Formata a coluna inteira (ex: "B:B"), então as linhas acrescentadas depois já herdam o formato
+    for nome, formato in (formatos or {}).items():
+        if nome in cabecalho and nome in colunas:
+            letra = letra_coluna(cabecalho.index(nome) + 1)
+            worksheet.format(f"{letra}:{letra}", formato)
+
+
+def sincronizar_planilha(worksheet, nova_tabela, chave="Link", formatos=None, apagar_ausentes=True):
+    # nova_tabela: [cabeçalho] + linhas. formatos: {nome_coluna: formato} (ex: FORMATO_PRECO),
+    # aplicados só quando a coluna é nova ou a aba estava vazia (o formato de coluna inteira persiste).
+    with METRICAS.cronometro("etapa_segundos", etapa="planilha"):
+        dif = gravar_diferencas(worksheet, nova_tabela, chave, formatos, apagar_ausentes)
+    METRICAS.contar("planilha_alteracoes_total", len(dif["celulas"]), tipo="celulas")
+    METRICAS.contar("planilha_alteracoes_total", len(dif["novas"]), tipo="linhas_novas")
+    METRICAS.contar("planilha_alteracoes_total", len(dif["apagar"]), tipo="linhas_apagadas")
+    return dif
+
+
+def gravar_diferencas(worksheet, nova_tabela, chave="Link", formatos=None, apagar_ausentes=True):
+    atuais = worksheet.get_all_values(value_render_option="UNFORMATTED_VALUE")
+    dif = calcular_diferencas(atuais, nova_tabela, chave, apagar_ausentes)
+
+    aba_vazia = not atuais or not any(atuais[0])
+    if aba_vazia:
+        # Nada para comparar: grava tudo de uma vez
+        worksheet.update(range_name="A1", values=nova_tabela)
+        aplicar_formatos(worksheet, nova_tabela[0], formatos, list(formatos or {}))
+        print(f"🔄 Aba vazia: {len(nova_tabela) - 1} linhas gravadas de uma vez.")
+        return dif
+
+    # 1. Células alteradas (inclusive cabeçalhos de colunas novas), numa chamada só
+    if len(dif["cabecalho"]) > worksheet.col_count:
+        worksheet.add_cols(len(dif["cabecalho"]) - worksheet.col_count)
+    if dif["celulas"]:
+        worksheet.batch_update(montar_blocos(dif["celulas"]))
+
+    # 2. Linhas novas no fim (append expande a grade se precisar)
+    if dif["novas"]:
+        worksheet.append_rows(dif["novas"], table_range="A1")
+
+    # 3. Linhas que saíram do site: um único deleteDimension, de baixo para cima
+    if dif["apagar"]:
+        pedidos = [
+            {"deleteDimension": {"range": {"sheetId": worksheet.id, "dimension": "ROWS", "startIndex": inicio - 1, "endIndex": fim}}}
+            for inicio, fim in reversed(agrupar_consecutivos(dif["apagar"]))
+        ]
+        worksheet.spreadsheet.batch_update({"requests": pedidos})
+
+    # 4. Formatação só nas colunas que acabaram de ser criadas
+    aplicar_formatos(worksheet, dif["cabecalho"], formatos, dif["colunas_novas"])
+
+    print(f"🔄 Planilha sincronizada: {len(dif['celulas'])} células alteradas, "
+          f"{len(dif['novas'])} linhas novas, {len(dif['apagar'])} removidas.")
+    return dif
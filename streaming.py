@@ -0,0 +1,162 @@
+# --- PIPELINE EM STREAMING (PÁGINAS -> BENCHMARK -> RAM AO MESMO TEMPO) ---
+# No pipeline por etapas, o benchmark só começa quando a última página foi raspada e a RAM só
+# quando o benchmark terminou. Aqui cada página vai para a fila assim que é extraída:
+#   navegadores --(fila de páginas)--> casamento de CPU/GPU --(fila de links)--> workers de RAM
+# As filas têm tamanho máximo: se a RAM atrasar, o casamento espera; se o casamento atrasar, os
+# navegadores esperam antes de abrir a próxima página. O tempo total fica perto do da etapa mais
+# lenta (em vez da soma) e a memória não cresce com filas acumuladas.
+# O resultado final é o mesmo DataFrame do pipeline por etapas, gravado na planilha uma vez só.
+import os
+import queue
+import threading
+import time
+
+import pandas as pd
+
+from cache_http import CacheHTTP
+from cliente_http import ClienteHTTP
+from correspondencia import MotorCorrespondencia, scores_cpu, scores_gpu
+from custo_beneficio import PERFIS_PESO
+from incremental import CAMINHO_ESTADO, EstadoIncremental, impressao_digital
+from metricas import METRICAS, exportar_metricas
+from passmark import IDADE_MAXIMA_SNAPSHOT, obter_benchmarks
+from pipeline import PASTA_INTERMEDIARIOS, aplicar_custo_beneficio, caminho_intermediario, tabela_para_linhas
+import ram
+from ram import COLUNAS_RAM, CHAVES_RAM, criar_cliente, extrair_detalhes_ram
+from sincronizacao import sincronizar_planilha, FORMATO_PRECO
+
+# Páginas esperando o casamento / links esperando a busca de RAM
+TAMANHO_FILA_PAGINAS = 4
+TAMANHO_FILA_RAM = 64
+FIM = None  # marcador de fim de fila
+
+
+def rodar_streaming(worksheet=None, url_base=None, num_workers=None, max_workers_ram=None, perfis=PERFIS_PESO,
+                    snapshot_fixo=None, incremental=False, caminho_estado=CAMINHO_ESTADO, pasta=PASTA_INTERMEDIARIOS, consultas=None):
+    # Mesmos parâmetros de rodar_pipeline (sem escolher etapas: aqui é sempre tudo).
+    # Devolve (df, tempos); os intermediários das três etapas ficam salvos como no pipeline.
+    from scraper import COLUNAS_SCRAPER, COLUNAS_LISTAGEM, juntar_paginas
+    from scraper_http import raspar
+
+    METRICAS.zerar()
+    inicio = time.time()
+    # Lido na hora (não no import): a célula 5 e o pipeline ajustam ram.MAX_WORKERS depois de importar
+    max_workers_ram = max_workers_ram or ram.MAX_WORKERS
+    cpu_db, gpu_db, snapshot_id = obter_benchmarks(IDADE_MAXIMA_SNAPSHOT, snapshot_fixo, ClienteHTTP(cache=CacheHTTP()))
+    motor_cpu, motor_gpu = MotorCorrespondencia(cpu_db), MotorCorrespondencia(gpu_db)
+    cliente_ram = criar_cliente()
+
+    estado = EstadoIncremental(caminho_estado) if incremental else None
+    conhecidos = estado.carregar() if estado is not None else {}
+
+    fila_paginas = queue.Queue(TAMANHO_FILA_PAGINAS)
+    fila_ram = queue.Queue(TAMANHO_FILA_RAM)
+    paginas = {}
+    scores = {}  # link -> (score cpu, score gpu)
+    infos_ram = {}  # link -> dict de detalhes
+    vistos = set()
+    concluidos = [0]
+    trava = threading.Lock()
+    tempos = {}
+    erros = []
+
+    def casar_paginas():
+        # Consome páginas inteiras: o casamento em lote por página aproveita o cache do motor
+        reaproveitados = 0
+        try:
+            while True:
+                item = fila_paginas.get()
+                if item is FIM: return
+                i, linhas = item
+                paginas[i] = linhas
+                novas = []
+                for linha in linhas:
+                    link = linha[6]
+                    # Link repetido em outra página ou outra consulta: já foi (ou está sendo) enriquecido
+                    if link in vistos: continue
+                    vistos.add(link)
+                    anterior = conhecidos.get(link)
+                    if anterior and anterior["impressao"] == impressao_digital(dict(zip(COLUNAS_SCRAPER, linha))):
+                        # snapshot None = download incompleto sem snapshot anterior: não reaproveita (como scores_conhecidos)
+                        if snapshot_id is not None and anterior["snapshot_id"] == snapshot_id and anterior["score_cpu"] is not None:
+                            scores[link] = (anterior["score_cpu"], anterior["score_gpu"])
+                            reaproveitados += 1
+                        if anterior["ram"]:
+                            infos_ram[link] = dict(zip(CHAVES_RAM, (anterior["ram"][c] for c in COLUNAS_RAM)))
+                    if link not in scores: novas.append(linha)
+                    if link not in infos_ram: fila_ram.put(link)  # bloqueia se a RAM estiver atrasada
+                try:
+                    for linha, cpu, gpu in zip(novas, scores_cpu([n[3] for n in novas], motor_cpu), scores_gpu([n[4] for n in novas], motor_gpu)):
+                        scores[linha[6]] = (cpu, gpu)
+                except Exception as e:
+                    print(f"⚠️ Erro ao casar a Página {i}: {e}")
+        except Exception as e:
+            print(f"❌ Casamento interrompido: {e}")
+            erros.append(e)
+            # Continua esvaziando a fila, senão o produtor trava no put e os join() nunca voltam
+            while True:
+                item = fila_paginas.get()
+                if item is FIM: break
+                paginas[item[0]] = item[1]
+        finally:
+            tempos["benchmark"] = time.time() - inicio
+            if reaproveitados: print(f"♻️ {reaproveitados} notebooks com specs iguais à última rodada: scores reaproveitados.")
+            for _ in range(max_workers_ram): fila_ram.put(FIM)
+
+    def buscar_ram():
+        while True:
+            link = fila_ram.get()
+            if link is FIM: break
+            try: info = extrair_detalhes_ram(link, cliente_ram)
+            except Exception as e:
+                # Worker morto deixaria a fila de RAM cheia e o casamento preso no put
+                info = {chave: "" for chave in CHAVES_RAM}
+                info["erro"] = f"{type(e).__name__}: {e}"
+            with trava:
+                infos_ram[link] = info
+                concluidos[0] += 1
+                feitos = concluidos[0]
+            print(f"[{feitos}] {info['geracao']} | S1: {info['slot1_val']} | S2: {info['slot2_val']}")
+
+    consumidores = [threading.Thread(target=casar_paginas)] + [threading.Thread(target=buscar_ram) for _ in range(max_workers_ram)]
+    for t in consumidores: t.start()
+    try:
+        # Produtor: o scraper (HTTP ou navegadores), cada página vai para a fila ao ser lida
+        raspar(consultas or url_base, num_workers, ao_extrair_pagina=lambda i, linhas: fila_paginas.put((i, linhas)))
+        tempos["scraper"] = time.time() - inicio
+    finally:
+        fila_paginas.put(FIM)
+        for t in consumidores: t.join()
+    if erros: raise erros[0]
+    tempos["ram"] = time.time() - inicio
+
+    # Monta a tabela final na ordem das páginas, igual ao pipeline por etapas
+    df = pd.DataFrame(juntar_paginas(paginas), columns=COLUNAS_LISTAGEM)
+    os.makedirs(pasta, exist_ok=True)
+    df.to_pickle(caminho_intermediario("scraper", pasta))
+    if estado is not None: print(f"📈 {estado.registrar_precos(df)} mudanças de preço/cupom no histórico.")
+
+    df.attrs["snapshot_benchmarks"] = snapshot_id
+    df["Score CPU"] = [scores.get(link, (0, 0))[0] for link in df["Link"]]
+    df["Score GPU"] = [scores.get(link, (0, 0))[1] for link in df["Link"]]
+    df = aplicar_custo_beneficio(df, perfis)
+    df.to_pickle(caminho_intermediario("benchmark", pasta))
+    for coluna, chave in zip(COLUNAS_RAM, CHAVES_RAM):
+        df[coluna] = pd.Series([infos_ram.get(link, {}).get(chave, "") for link in df["Link"]], index=df.index, dtype=object)
+    df.attrs["ram_falhas"] = [link for link, info in infos_ram.items() if "erro" in info]
+    if df.attrs["ram_falhas"]: print(f"⚠️ {len(df.attrs['ram_falhas'])} páginas de produto falharam (ficam para a próxima rodada).")
+    df.to_pickle(caminho_intermediario("ram", pasta))
+    if estado is not None: estado.salvar(df)
+    print(f"⏱️ Fim do scraper em {tempos['scraper']:.1f}s | benchmark em {tempos['benchmark']:.1f}s | RAM em {tempos['ram']:.1f}s")
+    # Aqui as etapas se sobrepõem: cada valor é o tempo desde o início até a etapa terminar
+    for etapa in ("scraper", "benchmark", "ram"):
+        METRICAS.observar("etapa_segundos", tempos[etapa], etapa=etapa)
+
+    if worksheet is not None:
+        print("\n💾 Publicando na planilha...")
+        inicio_planilha = time.time()
+        sincronizar_planilha(worksheet, tabela_para_linhas(df), formatos=FORMATO_PRECO)
+        tempos["planilha"] = time.time() - inicio_planilha
+
+    exportar_metricas()
+    return df, tempos